@@ -0,0 +1,60 @@
+"""Offline audit throughput: serial `allowed()` versus `bulk_allowed()` on 1, 2, 4 and all worker processes.
+
+Run from the repository root:
+
+    python benchmarks/bench_bulk.py
+"""
+
+import os
+import random
+import time
+
+from tagth import allowed
+from tagth.bulk import bulk_allowed
+
+TRIPLES = 400000
+DISTINCT_PRINCIPALS = 2000
+DISTINCT_ACLS = 5000
+DISTINCT_TRIPLES = 100000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share']
+
+    principals = [', '.join([f'dept_{rng.randrange(100)}'] + rng.sample(tags, 10)) for _ in range(DISTINCT_PRINCIPALS)]
+    acls = [', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 2))}}}' for tag in rng.sample(tags, 5)) for _ in range(DISTINCT_ACLS)]
+    triples = [(rng.choice(principals), rng.choice(acls), rng.choice(actions)) for _ in range(TRIPLES)]
+
+    start = time.perf_counter()
+    expected = [allowed(p, r, a) for (p, r, a) in triples]
+    serial = time.perf_counter() - start
+    print(f'{TRIPLES} triples ({DISTINCT_PRINCIPALS} principals, {DISTINCT_ACLS} ACLs)')
+    print(f'allowed() serial:          {serial:>7.2f} s')
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        decisions = list(bulk_allowed(triples, max_workers=workers))
+        elapsed = time.perf_counter() - start
+        assert decisions == expected
+        print(f'bulk_allowed() x{workers:<3}       {elapsed:>7.2f} s ({serial / elapsed:.1f}x)')
+
+    # One-off strings: nothing is reused, so this measures the per-string overhead.
+    triples = [(f'{p}, user_{i}', f'{r}, user_{i}:read', a) for i, (p, r, a) in enumerate(triples[:DISTINCT_TRIPLES])]
+
+    start = time.perf_counter()
+    expected = [allowed(p, r, a) for (p, r, a) in triples]
+    serial = time.perf_counter() - start
+    print(f'{DISTINCT_TRIPLES} triples, all strings distinct')
+    print(f'allowed() serial:          {serial:>7.2f} s')
+
+    start = time.perf_counter()
+    decisions = list(bulk_allowed(triples, max_workers=1))
+    elapsed = time.perf_counter() - start
+    assert decisions == expected
+    print(f'bulk_allowed() x1          {elapsed:>7.2f} s ({serial / elapsed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Loading a stored ACL: parsing the string form versus decoding the binary form.
+
+Run from the repository root:
+
+    python benchmarks/bench_codec.py
+"""
+
+import random
+import timeit
+
+from tagth import compile_resource, decode_resource, encode_resource
+from tagth.codec import decode_pairs
+from tagth.tagth import _normalize_resource
+
+ACLS = 2000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share', 'read_metadata']
+
+    for size in (1, 5, 20):
+        strings = [', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 3))}}}' for tag in rng.sample(tags, size)) for _ in range(ACLS)]
+        blobs = [encode_resource(s) for s in strings]
+        length = sum(map(len, strings)) / ACLS
+        encoded = sum(map(len, blobs)) / ACLS
+
+        timings = {
+            'parse pairs': min(timeit.repeat(lambda: [_normalize_resource(s) for s in strings], number=1, repeat=5)),
+            'decode pairs': min(timeit.repeat(lambda: [decode_pairs(b) for b in blobs], number=1, repeat=5)),
+            'compile string': min(timeit.repeat(lambda: [compile_resource(s) for s in strings], number=1, repeat=5)),
+            'decode compiled': min(timeit.repeat(lambda: [decode_resource(b) for b in blobs], number=1, repeat=5)),
+        }
+
+        print(f'{size} tags per ACL ({length:.0f} chars, {encoded:.0f} bytes encoded):')
+        for name, elapsed in timings.items():
+            print(f'  {name:<16} {elapsed / ACLS * 1e6:7.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Per-call cost of the scanner parse engine versus the pyparsing reference engine.
+
+Run from the repository root:
+
+    python benchmarks/bench_engines.py
+"""
+
+import timeit
+
+from tagth.tagth import _parse_principal_reference, _parse_resource_reference, _scan_principal, _scan_resource
+
+PRINCIPALS = {
+    'small': 'user',
+    'medium': ', '.join(f'tag_{i}' for i in range(10)),
+    'large': ', '.join(f'tag_{i}' for i in range(100)),
+}
+
+RESOURCES = {
+    'small': 'content:read',
+    'medium': ', '.join(f'tag_{i}:{{read, write}}' for i in range(10)),
+    'large': ', '.join(f'tag_{i}:{{read, write, delete}}' for i in range(100)),
+}
+
+
+def _best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def _report(kind, reference, scanner, samples):
+    for size, sample in samples.items():
+        number = 2000 if size == 'small' else 200
+        slow = _best(lambda: reference(sample), number)
+        fast = _best(lambda: scanner(sample), number)
+        print(f'{kind:<10} {size:<7} {slow * 1e6:>10.1f} us {fast * 1e6:>10.2f} us {slow / fast:>8.1f}x')
+
+
+def main():
+    print(f'{"grammar":<10} {"size":<7} {"pyparsing":>13} {"scanner":>13} {"speedup":>9}')
+    _report('principal', _parse_principal_reference, _scan_principal, PRINCIPALS)
+    _report('resource', _parse_resource_reference, _scan_resource, RESOURCES)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Evaluation time of `allowed()` with compiled and string principals and resources.
+
+Complements bench_memory.py: the compact compiled form must not make evaluation slower.
+
+Run from the repository root:
+
+    python benchmarks/bench_evaluation.py
+"""
+
+import timeit
+
+from tagth.tagth import allowed, compile_principal, compile_resource
+
+ACTIONS = ('read', 'write', 'delete')
+
+# (name, principal, resource, action); the large ACL denies, so every pair is visited.
+CASES = [
+    ('small ACL', 'user, content', 'content:{read, write}, anyone:list', 'write'),
+    ('5 tags', 'user, dept_2', ', '.join(f'dept_{i}_project:{{read, write}}' for i in range(5)), 'write'),
+    ('50 tags x 3 actions', 'user, other', ', '.join(f'dept_{i}_project:{{{", ".join(ACTIONS)}}}' for i in range(50)), 'share'),
+]
+
+
+def _us_per_call(stmt) -> float:
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    for (name, principal, resource, action) in CASES:
+        compiled_principal, compiled_resource = compile_principal(principal), compile_resource(resource)
+        compiled = _us_per_call(lambda: allowed(compiled_principal, compiled_resource, action))
+        strings = _us_per_call(lambda: allowed(principal, resource, action))
+        print(f'{name:<20} compiled {compiled:8.2f} us   strings {strings:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
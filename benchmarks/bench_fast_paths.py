@@ -0,0 +1,55 @@
+"""Normalizing a realistic traffic mix with and without the trivial-shape fast paths.
+
+Run from the repository root:
+
+    python benchmarks/bench_fast_paths.py
+"""
+
+import random
+import timeit
+
+from tagth.tagth import _normalize_principal, _normalize_resource, _scan_principal, _scan_resource
+
+CHECKS = 50000
+
+# (share, principal, resource) shapes of a typical API mix: service accounts with root, anonymous
+# callers, single-tag users against public and single-pair ACLs, and multi-tag traffic.
+MIX = [
+    (0.10, 'root', 'content_{}:{{read, write}}'),
+    (0.15, '', 'anyone:read'),
+    (0.05, 'void', ''),
+    (0.40, 'user_{}', 'content_{}:read'),
+    (0.30, 'user_{}, editor, team_{}', 'content_{}:{{read, write}}, anyone:list'),
+]
+
+
+def _traffic(rng):
+    traffic = []
+
+    for (share, principal, resource) in MIX:
+        for _ in range(round(CHECKS * share)):
+            traffic.append((principal.format(rng.randrange(100), rng.randrange(10)), resource.format(rng.randrange(1000))))
+
+    rng.shuffle(traffic)
+    return traffic
+
+
+def _scan_resource_or_void(resource):
+    return _scan_resource(resource) if resource else []
+
+
+def main():
+    traffic = _traffic(random.Random(42))
+    principals = [p for (p, _) in traffic]
+    resources = [r for (_, r) in traffic]
+
+    for name, normalize_principal, normalize_resource in (
+        ('scanner only', _scan_principal, _scan_resource_or_void),
+        ('with fast paths', _normalize_principal, _normalize_resource),
+    ):
+        elapsed = min(timeit.repeat(lambda: ([normalize_principal(p) for p in principals], [normalize_resource(r) for r in resources]), number=1, repeat=5))
+        print(f'{name:<16} {elapsed / CHECKS * 1e6:6.2f} us per principal and resource')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Per-call cost of building the pyparsing grammars versus reusing the shared reference parsers.
+
+Run from the repository root:
+
+    python benchmarks/bench_grammar.py
+"""
+
+import timeit
+
+from tagth.tagth import _build_principal_parser, _build_resource_parser, _get_reference_parsers
+
+PRINCIPALS = {
+    'small': 'user',
+    'medium': ', '.join(f'tag_{i}' for i in range(10)),
+    'large': ', '.join(f'tag_{i}' for i in range(100)),
+}
+
+RESOURCES = {
+    'small': 'content:read',
+    'medium': ', '.join(f'tag_{i}:{{read, write}}' for i in range(10)),
+    'large': ', '.join(f'tag_{i}:{{read, write, delete}}' for i in range(100)),
+}
+
+
+def _best(stmt, number):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def _report(kind, build, cached, samples):
+    for size, sample in samples.items():
+        number = 2000 if size == 'small' else 200
+        rebuilt = _best(lambda: build().parseString(sample), number)
+        reused = _best(lambda: cached.parseString(sample), number)
+        print(f'{kind:<10} {size:<7} {rebuilt * 1e6:>10.1f} us {reused * 1e6:>10.1f} us {rebuilt / reused:>7.2f}x')
+
+
+def main():
+    print(f'{"grammar":<10} {"size":<7} {"rebuilt":>13} {"reused":>13} {"speedup":>8}')
+    principal_parser, resource_parser = _get_reference_parsers()
+    _report('principal', _build_principal_parser, principal_parser, PRINCIPALS)
+    _report('resource', _build_resource_parser, resource_parser, RESOURCES)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Index lookups versus scans: the resources a principal may act on (`ResourceIndex`) and the
+principals that may act on a resource (`PrincipalIndex`).
+
+Run from the repository root:
+
+    python benchmarks/bench_index.py
+"""
+
+import random
+import time
+
+from tagth import PrincipalIndex, ResourceIndex, allowed, allowed_many, compile_principal
+
+QUERIES = 20
+PRINCIPALS = 200000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share']
+    principals = [', '.join(rng.sample(tags, 5)) for _ in range(QUERIES)]
+
+    for count in (10000, 100000):
+        resources = [', '.join(f'{tag}:{rng.choice(actions)}' for tag in rng.sample(tags, 3)) for _ in range(count)]
+
+        start = time.perf_counter()
+        index = ResourceIndex(enumerate(resources))
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned = [allowed_many(p, resources, 'read') for p in principals]
+        scan = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        found = [index.allowed(p, 'read') for p in principals]
+        lookup = (time.perf_counter() - start) / QUERIES
+
+        assert found == [{i for i, decision in enumerate(row) if decision} for row in scanned]
+        print(f'{count:>7} resources: build {build:.2f} s, scan {scan * 1e3:8.2f} ms, '
+              f'index {lookup * 1e3:6.3f} ms ({scan / lookup:.0f}x)')
+
+    principals = [', '.join(rng.sample(tags, 5)) for _ in range(PRINCIPALS)]
+    resources = [', '.join(f'{tag}:{rng.choice(actions)}' for tag in rng.sample(tags, 3)) for _ in range(QUERIES)]
+
+    start = time.perf_counter()
+    index = PrincipalIndex(enumerate(principals))
+    build = time.perf_counter() - start
+
+    compiled = [compile_principal(p) for p in principals]
+    start = time.perf_counter()
+    scanned = [{i for i, p in enumerate(compiled) if allowed(p, r, 'read')} for r in resources]
+    scan = (time.perf_counter() - start) / QUERIES
+
+    start = time.perf_counter()
+    found = [index.allowed(r, 'read') for r in resources]
+    lookup = (time.perf_counter() - start) / QUERIES
+
+    assert found == scanned
+    print(f'{PRINCIPALS:>7} principals: build {build:.2f} s, scan {scan * 1e3:8.2f} ms, '
+          f'index {lookup * 1e3:6.3f} ms ({scan / lookup:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
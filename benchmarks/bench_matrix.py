@@ -0,0 +1,43 @@
+"""Audit-style evaluation: nested `allowed_many()` calls versus the numpy permission matrix.
+
+Requires numpy. Run from the repository root:
+
+    python benchmarks/bench_matrix.py
+"""
+
+import random
+import time
+
+from tagth import allowed_many
+from tagth.matrix import permission_matrix
+
+PRINCIPALS = 500
+RESOURCES = 20000
+DISTINCT_ACLS = 2000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share']
+
+    principals = [', '.join([f'dept_{rng.randrange(100)}'] + rng.sample(tags, 10)) for _ in range(PRINCIPALS)]
+    acls = [', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 2))}}}' for tag in rng.sample(tags, 5)) for _ in range(DISTINCT_ACLS)]
+    resources = [rng.choice(acls) for _ in range(RESOURCES)]
+
+    start = time.perf_counter()
+    expected = [allowed_many(p, resources, 'read') for p in principals]
+    nested = time.perf_counter() - start
+
+    start = time.perf_counter()
+    matrix = permission_matrix(principals, resources, 'read')
+    vectorized = time.perf_counter() - start
+
+    assert matrix.tolist() == expected
+    print(f'{PRINCIPALS} principals x {RESOURCES} resources ({DISTINCT_ACLS} distinct ACLs)')
+    print(f'allowed_many() per principal: {nested:>7.2f} s')
+    print(f'permission_matrix():          {vectorized:>7.2f} s ({nested / vectorized:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Memory held by a large in-process cache of parsed ACLs: pair lists versus compiled resources.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py
+"""
+
+import random
+import tracemalloc
+
+from tagth.tagth import _normalize_resource, compile_resource
+
+ACLS = 20000
+
+
+def _measure(build, sources):
+    tracemalloc.start()
+    cache = [build(source) for source in sources]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, cache
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'tenant_{i}_team_{j}' for i in range(50) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share', 'list', 'all']
+    sources = [
+        ', '.join(f'{rng.choice(tags)}:{{{", ".join(rng.sample(actions, 3))}}}' for _ in range(4)) + ', anyone:list'
+        for _ in range(ACLS)
+    ]
+
+    # Intern the vocabulary up front, as a warm process would have.
+    compile_resource(', '.join(f'{tag}:{{{", ".join(actions)}}}' for tag in tags))
+
+    pairs, _ = _measure(_normalize_resource, sources)
+    compiled, _ = _measure(compile_resource, sources)
+
+    print(f'{ACLS} cached ACLs')
+    print(f'pair lists:         {pairs / ACLS:>8.0f} bytes per ACL')
+    print(f'compiled resources: {compiled / ACLS:>8.0f} bytes per ACL ({compiled / pairs:.0%})')
+
+
+if __name__ == '__main__':
+    main()
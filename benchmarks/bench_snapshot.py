@@ -0,0 +1,50 @@
+"""Loading policies in a fresh worker: parsing strings versus reading a memory-mapped snapshot.
+
+Run from the repository root:
+
+    python benchmarks/bench_snapshot.py
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from tagth import PolicySnapshot, compile_principal, compile_resource, write_snapshot
+
+PRINCIPALS = 10000
+RESOURCES = 50000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share']
+    principals = [', '.join(rng.sample(tags, 10)) for _ in range(PRINCIPALS)]
+    resources = [', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 2))}}}' for tag in rng.sample(tags, 5)) for _ in range(RESOURCES)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'policy.snapshot')
+
+        start = time.perf_counter()
+        write_snapshot(path, principals, resources)
+        print(f'write_snapshot(): {time.perf_counter() - start:.2f} s, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+
+        for name, strings, compile_function in (('principals', principals, compile_principal), ('resources', resources, compile_resource)):
+            start = time.perf_counter()
+            for string in strings:
+                compile_function(string)
+            parsed = (time.perf_counter() - start) / len(strings)
+
+            with PolicySnapshot(path) as snapshot:
+                load = snapshot.principal if name == 'principals' else snapshot.resource
+                start = time.perf_counter()
+                for string in strings:
+                    load(string)
+                mapped = (time.perf_counter() - start) / len(strings)
+
+            print(f'{name:<10}  parse {parsed * 1e6:6.2f} us, snapshot {mapped * 1e6:6.2f} us ({parsed / mapped:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Supertag matching: the nested prefix loop versus prefix tuples and bisection.
+
+Prints the cost of matching one principal against one resource for growing principal
+sizes, so the crossover points between the strategies are visible. `CompiledPrincipal.covers()`
+switches from the prefix tuple to bisection at `_BISECT_MIN_SUPERTAGS`.
+
+Run from the repository root:
+
+    python benchmarks/bench_supertags.py
+"""
+
+import random
+import timeit
+from bisect import bisect_right
+
+from tagth.tagth import _BISECT_MIN_SUPERTAGS, _minimal_supertags, compile_principal, compile_resource
+
+RESOURCE_TAGS = 50
+PRINCIPAL_SIZES = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _nested_loop(tags, tag_actions):
+    actions = set()
+
+    for pr_tag in tags:
+        for (res_tag, acts) in tag_actions.items():
+            if res_tag.startswith(pr_tag):
+                actions.update(acts)
+
+    return actions
+
+
+def _prefix_tuple(supertags, tag_actions):
+    actions = set()
+
+    for (res_tag, acts) in tag_actions.items():
+        if res_tag.startswith(supertags):
+            actions.update(acts)
+
+    return actions
+
+
+def _bisect(supertags, tag_actions):
+    actions = set()
+
+    for (res_tag, acts) in tag_actions.items():
+        index = bisect_right(supertags, res_tag)
+        if index > 0 and res_tag.startswith(supertags[index - 1]):
+            actions.update(acts)
+
+    return actions
+
+
+def _best(stmt, number=1000):
+    return min(timeit.repeat(stmt, number=number, repeat=5)) / number
+
+
+def main():
+    rng = random.Random(42)
+    vocabulary = [f'team_{i}_project_{j}' for i in range(100) for j in range(10)]
+    resource = compile_resource(', '.join(f'{tag}:{{read, write}}' for tag in rng.sample(vocabulary, RESOURCE_TAGS)))
+    tag_actions = resource.tag_actions
+
+    print(f'bisection starts at {_BISECT_MIN_SUPERTAGS} minimal supertags')
+    print(f'{"principal tags":>15} {"nested loop":>13} {"prefix tuple":>13} {"bisect":>13}')
+
+    for size in PRINCIPAL_SIZES:
+        tags = rng.sample(vocabulary, size - size // 4) + [f'team_{i}' for i in rng.sample(range(100), size // 4)]
+        principal = compile_principal(', '.join(tags))
+        supertags = _minimal_supertags(principal.tags)
+
+        expected = _nested_loop(principal.tags, tag_actions)
+        assert _prefix_tuple(supertags, tag_actions) == expected
+        assert _bisect(supertags, tag_actions) == expected
+
+        loop = _best(lambda: _nested_loop(principal.tags, tag_actions))
+        prefix = _best(lambda: _prefix_tuple(supertags, tag_actions))
+        bisect = _best(lambda: _bisect(supertags, tag_actions))
+        print(f'{size:>15} {loop * 1e6:>10.1f} us {prefix * 1e6:>10.1f} us {bisect * 1e6:>10.1f} us')
+
+
+if __name__ == '__main__':
+    main()
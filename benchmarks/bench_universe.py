@@ -0,0 +1,47 @@
+"""Per-check cost of `TagUniverse.allowed()` versus `allowed()` on compiled policies.
+
+Run from the repository root:
+
+    python benchmarks/bench_universe.py
+"""
+
+import random
+import timeit
+
+from tagth import TagUniverse, allowed, compile_principal, compile_resource
+
+CHECKS = 10000
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share', 'list', 'admin']
+    universe = TagUniverse(tags, actions)
+
+    raw_principals = [', '.join([f'dept_{rng.randrange(100)}' for _ in range(3)] + rng.sample(tags, 20)) for _ in range(100)]
+    raw_resources = [', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 2))}}}' for tag in rng.sample(tags, 8)) for _ in range(100)]
+    checks = [(rng.randrange(100), rng.randrange(100), rng.choice(actions)) for _ in range(CHECKS)]
+
+    principals = [compile_principal(p) for p in raw_principals]
+    resources = [compile_resource(r) for r in raw_resources]
+    universe_principals = [universe.compile_principal(p) for p in principals]
+    universe_resources = [universe.compile_resource(r) for r in resources]
+
+    def compiled():
+        return [allowed(principals[p], resources[r], a) for (p, r, a) in checks]
+
+    def bitset():
+        return [universe.allowed(universe_principals[p], universe_resources[r], a) for (p, r, a) in checks]
+
+    assert compiled() == bitset()
+
+    compiled_time = min(timeit.repeat(compiled, number=3, repeat=5)) / 3 / CHECKS
+    bitset_time = min(timeit.repeat(bitset, number=3, repeat=5)) / 3 / CHECKS
+    print(f'{len(universe.tags)} universe tags, {CHECKS} checks')
+    print(f'compiled allowed(): {compiled_time * 1e6:>7.2f} us per check')
+    print(f'TagUniverse:        {bitset_time * 1e6:>7.2f} us per check ({compiled_time / bitset_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
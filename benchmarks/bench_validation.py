@@ -0,0 +1,43 @@
+"""Validating an import batch: `validate_resource()` per string versus streaming `validate_resources()`.
+
+Run from the repository root:
+
+    python benchmarks/bench_validation.py
+"""
+
+import random
+import time
+
+from tagth import PARSE_ENGINE_PYPARSING, PARSE_ENGINE_SCANNER, set_parse_engine, validate_resource, validate_resources
+
+STRINGS = 20000
+INVALID_SHARE = 0.2
+
+
+def main():
+    rng = random.Random(42)
+    tags = [f'dept_{i}_team_{j}' for i in range(100) for j in range(20)]
+    actions = ['read', 'write', 'delete', 'share']
+    strings = []
+
+    for _ in range(STRINGS):
+        string = ', '.join(f'{tag}:{{{", ".join(rng.sample(actions, 2))}}}' for tag in rng.sample(tags, 3))
+        if rng.random() < INVALID_SHARE:
+            position = rng.randrange(len(string))
+            string = string[:position] + rng.choice('{}:@') + string[position:]
+        strings.append(string)
+
+    for engine in (PARSE_ENGINE_PYPARSING, PARSE_ENGINE_SCANNER):
+        set_parse_engine(engine)
+        start = time.perf_counter()
+        expected = [index for index, string in enumerate(strings) if not validate_resource(string)]
+        print(f'validate_resource() ({engine}): {time.perf_counter() - start:6.2f} s')
+
+    start = time.perf_counter()
+    issues = list(validate_resources(strings))
+    print(f'validate_resources():            {time.perf_counter() - start:6.2f} s ({len(issues)} invalid)')
+    assert [issue.index for issue in issues] == expected
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""Offline benchmark suite for parsing, resolution and `allowed()`.
+
+Times `_normalize_principal`, `_normalize_resource`, `_resolve_internal` and `allowed` over the
+generated workloads in `workloads.py` and writes the results as JSON, so runs from different
+commits can be compared.
+
+Run from the repository root:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --output after.json --compare before.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+
+from tagth.tagth import _normalize_principal, _normalize_resource, _resolve_internal, allowed
+from workloads import workloads
+
+REPEAT = 5
+
+
+def _commit() -> str:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+    return result.stdout.strip()
+
+
+def _ns_per_call(stmt) -> float:
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1e9
+
+
+def _benchmarks(workload):
+    principal = _normalize_principal(workload.principal)
+    resource = _normalize_resource(workload.resource)
+
+    return {
+        'normalize_principal': lambda: _normalize_principal(workload.principal),
+        'normalize_resource': lambda: _normalize_resource(workload.resource),
+        'resolve_internal': lambda: _resolve_internal(principal, resource),
+        'allowed': lambda: allowed(workload.principal, workload.resource, workload.action),
+    }
+
+
+def run(selected=None) -> dict:
+    results = []
+
+    for workload in workloads():
+        for name, stmt in _benchmarks(workload).items():
+            if selected and name not in selected:
+                continue
+
+            results.append({
+                'benchmark': name,
+                'workload': workload.name,
+                'params': workload.params,
+                'ns_per_call': round(_ns_per_call(stmt), 1),
+            })
+            print(f'{name:<20} {workload.name:<45} {results[-1]["ns_per_call"]:>12.1f} ns', file=sys.stderr)
+
+    return {
+        'meta': {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timestamp': int(time.time()),
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    previous = {(r['benchmark'], r['workload']): r['ns_per_call'] for r in baseline['results']}
+    regressions = []
+
+    for result in current['results']:
+        before = previous.get((result['benchmark'], result['workload']))
+        if before is None:
+            continue
+
+        ratio = result['ns_per_call'] / before
+        line = f'{result["benchmark"]:<20} {result["workload"]:<45} {ratio:>7.2f}x'
+        print(line, file=sys.stderr)
+
+        if ratio > 1 + threshold:
+            regressions.append(line)
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', type=Path, help='write JSON results to this file instead of stdout')
+    parser.add_argument('--compare', type=Path, help='JSON results of a baseline run')
+    parser.add_argument('--threshold', type=float, default=0.1, help='tolerated slowdown ratio (default: 0.1)')
+    parser.add_argument('--only', action='append', help='run only the named benchmark (repeatable)')
+    args = parser.parse_args()
+
+    current = run(args.only)
+    report = json.dumps(current, indent=2)
+
+    if args.output:
+        args.output.write_text(report + '\n')
+    else:
+        print(report)
+
+    if args.compare:
+        regressions = compare(current, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f'{len(regressions)} regression(s) above {args.threshold:.0%}', file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
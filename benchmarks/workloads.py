@@ -0,0 +1,59 @@
+"""Deterministic generated workloads for the benchmark suite."""
+
+import random
+from typing import NamedTuple
+
+BASE = {'tags': 10, 'group': 4, 'overlap': 0.5, 'mix': 'plain'}
+
+VARIATIONS = {
+    'tags': (1, 10, 100),
+    'group': (1, 4, 16),
+    'overlap': (0.0, 0.5, 1.0),
+    'mix': ('plain', 'root', 'void', 'anyone'),
+}
+
+
+class Workload(NamedTuple):
+    name: str
+    params: dict
+    principal: str
+    resource: str
+    action: str
+
+
+def _make(params: dict, seed: int = 42) -> Workload:
+    rng = random.Random(seed)
+    tags, group, overlap, mix = params['tags'], params['group'], params['overlap'], params['mix']
+
+    resource_tags = [f'dept_{i}_project_{rng.randrange(1000)}' for i in range(tags)]
+    actions = [f'action_{j}' for j in range(group)]
+
+    # Overlapping principal tags are supertags of resource tags; the rest match nothing.
+    overlapping = round(tags * overlap)
+    principal_tags = [tag.rsplit('_', 2)[0] for tag in resource_tags[:overlapping]]
+    principal_tags += [f'other_{i}' for i in range(tags - overlapping)]
+
+    if mix == 'root':
+        principal_tags.append('root')
+    elif mix == 'void':
+        principal_tags = ['void']
+
+    modules = [f'{tag}:{{{", ".join(actions)}}}' if group > 1 else f'{tag}:{actions[0]}' for tag in resource_tags]
+
+    if mix == 'anyone':
+        modules.append('anyone:action_0')
+
+    name = ','.join(f'{key}={value}' for key, value in params.items())
+    return Workload(name, dict(params), ', '.join(principal_tags), ', '.join(modules), actions[-1])
+
+
+def workloads() -> list[Workload]:
+    """Varies one dimension at a time around the base workload."""
+    seen = {}
+
+    for key, values in VARIATIONS.items():
+        for value in values:
+            workload = _make({**BASE, key: value})
+            seen.setdefault(workload.name, workload)
+
+    return list(seen.values())
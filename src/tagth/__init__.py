@@ -1,23 +1,83 @@
 from .tagth import (
     allowed,
+    compile_principal,
+    CompiledPrincipal,
+    compile_resource,
+    CompiledResource,
     validate_principal,
     validate_resource,
+    validate_principals,
+    validate_resources,
+    ValidationIssue,
+    VALIDATION_BAD_TYPE,
+    VALIDATION_BAD_FORMAT,
+    VALIDATION_TOO_LARGE,
+    set_parse_engine,
+    get_parse_engine,
+    set_parse_limits,
+    get_parse_limits,
+    ParseLimits,
+    enable_cache,
+    disable_cache,
+    cache_stats,
+    CacheStats,
     TagthValidationError,
     FULL_ACCESS_ACTION,
     ANYONE_PRINCIPAL,
     ROOT_PRINCIPAL,
     VOID_PRINCIPAL,
-    VOID_RESOURCE
+    VOID_RESOURCE,
+    PARSE_ENGINE_SCANNER,
+    PARSE_ENGINE_PYPARSING
 )
+from .batch import allowed_many, filter_allowed, afilter_allowed
+from .universe import TagUniverse
+from .index import PrincipalIndex, ResourceIndex
+from .canonical import canonicalize_principal, canonicalize_resource
+from .codec import encode_resource, decode_resource
+from .snapshot import PolicySnapshot, write_snapshot
 
 __all__ = [
     'allowed',
+    'allowed_many',
+    'filter_allowed',
+    'afilter_allowed',
+    'TagUniverse',
+    'ResourceIndex',
+    'PrincipalIndex',
+    'canonicalize_principal',
+    'canonicalize_resource',
+    'encode_resource',
+    'decode_resource',
+    'PolicySnapshot',
+    'write_snapshot',
+    'compile_principal',
+    'CompiledPrincipal',
+    'compile_resource',
+    'CompiledResource',
     'validate_principal',
     'validate_resource',
+    'validate_principals',
+    'validate_resources',
+    'ValidationIssue',
+    'VALIDATION_BAD_TYPE',
+    'VALIDATION_BAD_FORMAT',
+    'VALIDATION_TOO_LARGE',
+    'set_parse_engine',
+    'get_parse_engine',
+    'set_parse_limits',
+    'get_parse_limits',
+    'ParseLimits',
+    'enable_cache',
+    'disable_cache',
+    'cache_stats',
+    'CacheStats',
     'TagthValidationError',
     'FULL_ACCESS_ACTION',
     'ANYONE_PRINCIPAL',
     'ROOT_PRINCIPAL',
     'VOID_PRINCIPAL',
-    'VOID_RESOURCE'
+    'VOID_RESOURCE',
+    'PARSE_ENGINE_SCANNER',
+    'PARSE_ENGINE_PYPARSING'
 ]
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from typing import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator, Optional, TypeVar, Union
+
+from .tagth import (
+    CompiledPrincipal,
+    CompiledResource,
+    TagthValidationError,
+    _allowed_internal,
+    _load_resource,
+    _Principal,
+    _query_principal,
+)
+
+T = TypeVar('T')
+
+
+class _DecisionCache:
+    # A small per-stream LRU of decisions keyed by resource, so memory stays bounded
+    # however long the stream is.
+
+    def __init__(self, principal: _Principal, action: str, max_entries: int):
+        self._principal = principal
+        self._action = action
+        self._max_entries = max_entries
+        self._decisions = OrderedDict()
+
+    def allowed(self, resource: Union[str, CompiledResource]) -> bool:
+        decisions = self._decisions
+
+        try:
+            decision = decisions.get(resource)
+        except TypeError:
+            return _allowed_internal(self._principal, _load_resource(resource), self._action)
+
+        if decision is None:
+            decision = decisions[resource] = _allowed_internal(self._principal, _load_resource(resource), self._action)
+            if len(decisions) > self._max_entries:
+                decisions.popitem(last=False)
+        else:
+            decisions.move_to_end(resource)
+
+        return decision
+
+
+def _prepare_stream(principal: Union[str, CompiledPrincipal], action: str, cache_size: int) -> _DecisionCache:
+    if not isinstance(action, str):
+        raise TagthValidationError('Bad action: expected a string')
+    if cache_size < 1:
+        raise ValueError('cache_size must be positive')
+
+    return _DecisionCache(_query_principal(principal), action, cache_size)
+
+
+def _pack_bits(decisions: list[bool]) -> bytearray:
+    bits = bytearray((len(decisions) + 7) // 8)
+
+    for index, decision in enumerate(decisions):
+        if decision:
+            bits[index >> 3] |= 1 << (index & 7)
+
+    return bits
+
+
+def allowed_many(
+    principal: Union[str, CompiledPrincipal],
+    resources: Iterable[Union[str, CompiledResource]],
+    action: str,
+    bitmap: bool = False,
+) -> Union[list[bool], bytearray]:
+    """Checks if a principal is allowed to perform an action on each of many resources.
+
+    The principal is parsed once, and identical resource strings are evaluated once per batch.
+
+    Args:
+        principal (str | CompiledPrincipal): A string representing the principal tags, or a compiled principal.
+        resources (Iterable[str | CompiledResource]): The resource strings or compiled resources to check.
+        action (str): The action to check for permission.
+        bitmap (bool): Return a bitmap instead of a list; bit `i % 8` of byte `i // 8` is set if
+            the action is allowed on the `i`-th resource.
+
+    Returns:
+        list[bool] | bytearray: The decision for every resource, in input order.
+    """
+    if not isinstance(action, str):
+        raise TagthValidationError('Bad action: expected a string')
+
+    principal = _query_principal(principal)
+    known = {}
+    decisions = []
+
+    for resource in resources:
+        try:
+            decision = known.get(resource)
+        except TypeError:
+            decision = _allowed_internal(principal, _load_resource(resource), action)
+        else:
+            if decision is None:
+                decision = known[resource] = _allowed_internal(principal, _load_resource(resource), action)
+
+        decisions.append(decision)
+
+    return _pack_bits(decisions) if bitmap else decisions
+
+
+def filter_allowed(
+    principal: Union[str, CompiledPrincipal],
+    items: Iterable[T],
+    action: str,
+    key: Optional[Callable[[T], Union[str, CompiledResource]]] = None,
+    cache_size: int = 256,
+) -> Iterator[T]:
+    """Lazily yields the items a principal is allowed to perform an action on.
+
+    The principal is parsed once, before iteration starts. Decisions for recently seen resources
+    are kept in a small per-stream cache, so memory stays bounded for arbitrarily long streams.
+
+    Args:
+        principal (str | CompiledPrincipal): A string representing the principal tags, or a compiled principal.
+        items (Iterable): The items to filter, e.g. rows coming off a database cursor.
+        action (str): The action to check for permission.
+        key (Optional[Callable]): Extracts the resource string from an item; items are resources by default.
+        cache_size (int): The maximum number of resource decisions kept for the stream.
+
+    Returns:
+        Iterator: The permitted items, in input order.
+    """
+    decisions = _prepare_stream(principal, action, cache_size)
+    return _filter(decisions, items, key)
+
+
+def _filter(decisions: _DecisionCache, items: Iterable[T], key) -> Iterator[T]:
+    for item in items:
+        if decisions.allowed(item if key is None else key(item)):
+            yield item
+
+
+def afilter_allowed(
+    principal: Union[str, CompiledPrincipal],
+    items: AsyncIterable[T],
+    action: str,
+    key: Optional[Callable[[T], Union[str, CompiledResource]]] = None,
+    cache_size: int = 256,
+) -> AsyncIterator[T]:
+    """The asynchronous twin of `filter_allowed()` for async iterators.
+
+    Args:
+        principal (str | CompiledPrincipal): A string representing the principal tags, or a compiled principal.
+        items (AsyncIterable): The items to filter, e.g. rows coming off an async database cursor.
+        action (str): The action to check for permission.
+        key (Optional[Callable]): Extracts the resource string from an item; items are resources by default.
+        cache_size (int): The maximum number of resource decisions kept for the stream.
+
+    Returns:
+        AsyncIterator: The permitted items, in input order.
+    """
+    decisions = _prepare_stream(principal, action, cache_size)
+    return _afilter(decisions, items, key)
+
+
+async def _afilter(decisions: _DecisionCache, items: AsyncIterable[T], key) -> AsyncIterator[T]:
+    async for item in items:
+        if decisions.allowed(item if key is None else key(item)):
+            yield item
@@ -0,0 +1,147 @@
+import os
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from .tagth import CompiledResource, TagthValidationError, _allowed_internal, _load_resource, _query_principal
+
+# The number of tasks kept in flight per worker: enough to keep every worker busy while the
+# parent reads the next window, few enough to bound the memory held by pending tasks.
+_TASKS_PER_WORKER = 2
+
+# The number of principals and of resources each worker keeps parsed between tasks.
+_CACHE_ENTRIES = 16384
+
+# Per-worker LRU caches of principal and resource strings. Principals are kept in their
+# non-interning evaluation form. A resource is first kept as its pairs and compiled when it is
+# seen again, so one-off ACLs never reach the worker's symbol table.
+_principals = OrderedDict()
+_resources = OrderedDict()
+
+
+def _evict(cache: OrderedDict) -> None:
+    if len(cache) > _CACHE_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _principal(principal: str):
+    value = _principals.get(principal)
+
+    if value is None:
+        value = _principals[principal] = _query_principal(principal)
+        _evict(_principals)
+    else:
+        _principals.move_to_end(principal)
+
+    return value
+
+
+def _resource(resource: str):
+    value = _resources.get(resource)
+
+    if value is None:
+        value = _resources[resource] = _load_resource(resource)
+        _evict(_resources)
+    else:
+        _resources.move_to_end(resource)
+
+        if not isinstance(value, CompiledResource):
+            value = _resources[resource] = CompiledResource(value)
+
+    return value
+
+
+def _evaluate(task: tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...], tuple[bytes, bytes, bytes]]) -> bytes:
+    principal_strings, resource_strings, actions, chunk = task
+    principals = [_principal(principal) for principal in principal_strings]
+    resources = [_resource(resource) for resource in resource_strings]
+    principal_ids, resource_ids, action_ids = (array('I', part) for part in chunk)
+    decisions = bytearray(len(principal_ids))
+
+    for index, (principal_id, resource_id, action_id) in enumerate(zip(principal_ids, resource_ids, action_ids)):
+        decisions[index] = _allowed_internal(principals[principal_id], resources[resource_id], actions[action_id])
+
+    return bytes(decisions)
+
+
+def bulk_allowed(
+    triples: Iterable[tuple[str, str, str]],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 10000,
+) -> Iterator[bool]:
+    """Evaluates many (principal, resource, action) triples on a pool of worker processes.
+
+    The input is read lazily, `chunk_size` triples per task, with a bounded number of tasks in
+    flight, so decisions stream back while the input is still being read. Each task carries the
+    distinct strings of its window once and integer IDs for the triples. Workers keep the
+    policies they parse in bounded LRU caches; principals are never interned, and a resource
+    is compiled only when it is seen again.
+
+    If reading the input fails, or an action is not a string, the decisions of the triples read
+    before it are yielded first and the error is raised after them.
+
+    Args:
+        triples (Iterable[tuple[str, str, str]]): The principal, resource and action strings to check.
+        max_workers (Optional[int]): The number of worker processes, by default the number of CPUs.
+        chunk_size (int): The number of triples per task.
+
+    Returns:
+        Iterator[bool]: The decisions, in input order, streamed as chunks complete.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+
+    return _stream(iter(triples), max_workers or os.cpu_count() or 1, chunk_size)
+
+
+def _read_window(triples: Iterator, chunk_size: int):
+    # Reads the next `chunk_size` triples into a task with its own string tables. Returns the
+    # task, or None at the end of the input, and the error that stopped reading early, if any.
+    indexes = ({}, {}, {})
+    ids = (array('I'), array('I'), array('I'))
+    error = None
+
+    try:
+        for (principal, resource, action) in islice(triples, chunk_size):
+            if not isinstance(action, str):
+                raise TagthValidationError('Bad action: expected a string')
+
+            for value, index, column in zip((principal, resource, action), indexes, ids):
+                column.append(index.setdefault(value, len(index)))
+    except Exception as exc:
+        error = exc
+
+        # A triple interrupted halfway has some columns one ID longer than the others.
+        for column in ids:
+            del column[len(ids[2]):]
+
+    if not ids[0]:
+        return None, error
+
+    return (*(tuple(index) for index in indexes), tuple(column.tobytes() for column in ids)), error
+
+
+def _stream(triples: Iterator, workers: int, chunk_size: int) -> Iterator[bool]:
+    pending = deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        error = None
+
+        while error is None:
+            task, error = _read_window(triples, chunk_size)
+
+            if task is None:
+                break
+
+            pending.append(executor.submit(_evaluate, task))
+
+            if len(pending) >= workers * _TASKS_PER_WORKER:
+                yield from map(bool, pending.popleft().result())
+
+        while pending:
+            yield from map(bool, pending.popleft().result())
+
+        if error is not None:
+            raise error
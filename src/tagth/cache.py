@@ -0,0 +1,107 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Type
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+def _estimate_size(key: str, value) -> int:
+    size = sys.getsizeof(key) + sys.getsizeof(value)
+
+    if isinstance(value, tuple):
+        for item in value:
+            size += sys.getsizeof(item)
+            if isinstance(item, tuple):
+                size += sum(sys.getsizeof(part) for part in item)
+
+    return size
+
+
+class LRUCache:
+    """A thread-safe, bounded least-recently-used cache in front of a normalizing function.
+
+    Failures of the loader with `error_type` are cached as well (negative caching), and are
+    re-raised on every later lookup with the same generic message and no exception context.
+
+    Args:
+        loader (Callable): The function computing the value for a missing key.
+        error_type (Type[Exception]): The validation error raised by the loader.
+        max_entries (int): The maximum number of cached keys.
+        max_bytes (Optional[int]): An approximate memory budget for keys and values, in bytes.
+    """
+
+    def __init__(self, loader: Callable, error_type: Type[Exception], max_entries: int = 4096, max_bytes: Optional[int] = None):
+        if max_entries < 1:
+            raise ValueError('max_entries must be positive')
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('max_bytes must be positive')
+
+        self._loader = loader
+        self._error_type = error_type
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+
+        if entry is None:
+            try:
+                valid, value = True, tuple(self._loader(key))
+            except self._error_type as e:
+                valid, value = False, str(e)
+
+            self._store(key, valid, value)
+        else:
+            valid, value, _ = entry
+
+        if not valid:
+            raise self._error_type(value) from None
+
+        return value
+
+    def _store(self, key: str, valid: bool, value) -> None:
+        size = _estimate_size(key, value)
+
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                return
+
+            self._entries[key] = (valid, value, size)
+            self._size += size
+
+            while len(self._entries) > self._max_entries or (self._max_bytes is not None and self._size > self._max_bytes):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._entries), self._size)
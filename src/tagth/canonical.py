@@ -0,0 +1,111 @@
+from typing import Union
+
+from .tagth import (
+    ACTION_DELIMETER,
+    ANYONE_PRINCIPAL,
+    BRACE_CLOSE,
+    BRACE_OPEN,
+    EMPTY_RESOURCE_TAG,
+    ROOT_PRINCIPAL,
+    TAG_LIST_DELIMETER,
+    VOID_PRINCIPAL,
+    VOID_RESOURCE,
+    CompiledPrincipal,
+    CompiledResource,
+    _load_resource,
+    _query_principal,
+)
+from .index import _granting_actions
+from .universe import _prefix_range
+
+_SEPARATOR = TAG_LIST_DELIMETER + ' '
+
+
+def _dominated(pair: tuple[str, str], tags_by_action: dict[str, list[str]], anyone_actions: set[str]) -> bool:
+    # A pair is redundant if another pair grants one of its granting actions, `all` or a prefix
+    # of its action, to `anyone` or to a tag extending its tag: every principal possessing the
+    # tag then possesses the other one too. The tags granted an action are sorted, so the tags
+    # extending the tag are one prefix range, which holds the pair itself for its own action.
+    res_tag, action = pair
+
+    for granted in _granting_actions(action):
+        if granted in anyone_actions and (res_tag != ANYONE_PRINCIPAL or granted != action):
+            return True
+
+        tags = tags_by_action.get(granted)
+
+        if tags is None or res_tag == ANYONE_PRINCIPAL:
+            continue
+
+        low, high = _prefix_range(tags, res_tag)
+
+        if high - low > (granted == action):
+            return True
+
+    return False
+
+
+def canonicalize_resource(resource: Union[str, CompiledResource]) -> str:
+    """Rewrites a resource string into its minimal equivalent form.
+
+    Duplicate pairs are dropped, as is every pair made redundant by another one: an action on
+    the same tag that is `all` or a superaction, or a grant on `anyone` or on a tag that extends
+    the tag. Empty modules grant nothing to non-root principals and are dropped too. The
+    remaining actions are merged into one brace group per tag, with tags and actions sorted.
+    `allowed()` gives the same result for the canonical string as for the original.
+
+    Args:
+        resource (str | CompiledResource): A string representing the pairs of tags and actions.
+
+    Returns:
+        str: The canonical resource string.
+    """
+    resource = _load_resource(resource)
+    pairs = sorted({pair for pair in (resource.pairs if isinstance(resource, CompiledResource) else resource) if pair[0] != EMPTY_RESOURCE_TAG})
+    tags_by_action = {}
+
+    # The pairs are sorted, so the tags of every action are appended in sorted order.
+    for (res_tag, action) in pairs:
+        tags_by_action.setdefault(action, []).append(res_tag)
+
+    anyone_actions = {action for (res_tag, action) in pairs if res_tag == ANYONE_PRINCIPAL}
+    grouped = {}
+
+    for pair in pairs:
+        if not _dominated(pair, tags_by_action, anyone_actions):
+            grouped.setdefault(pair[0], []).append(pair[1])
+
+    modules = []
+
+    for (res_tag, actions) in grouped.items():
+        if len(actions) == 1:
+            modules.append(res_tag + ACTION_DELIMETER + actions[0])
+        else:
+            modules.append(res_tag + ACTION_DELIMETER + BRACE_OPEN + _SEPARATOR.join(actions) + BRACE_CLOSE)
+
+    return _SEPARATOR.join(modules) or VOID_RESOURCE
+
+
+def canonicalize_principal(principal: Union[str, CompiledPrincipal]) -> str:
+    """Rewrites a principal string into its minimal equivalent form.
+
+    A root principal becomes `root`. Otherwise duplicate tags, `void` and empty modules are
+    dropped, as is every tag that has a shorter supertag in the principal: the supertag already
+    possesses every resource tag the longer one does. The remaining tags are sorted, and a
+    principal without tags becomes `void`. `allowed()` gives the same result for the canonical
+    string as for the original.
+
+    Args:
+        principal (str | CompiledPrincipal): A string representing the principal tags.
+
+    Returns:
+        str: The canonical principal string.
+    """
+    # `allowed()` only depends on `is_root` and on `covers()`, which only reads the minimal
+    # supertags, so a string that compiles to the same two is equivalent by construction.
+    principal = _query_principal(principal)
+
+    if principal.is_root:
+        return ROOT_PRINCIPAL
+
+    return _SEPARATOR.join(principal._supertags) or VOID_PRINCIPAL
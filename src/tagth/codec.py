@@ -0,0 +1,172 @@
+import re
+import struct
+from typing import Union
+
+from .symbols import SYMBOLS
+from .tagth import (
+    EMPTY_RESOURCE_TAG,
+    FULL_ACCESS_ACTION,
+    _IDENT_PATTERN,
+    CompiledResource,
+    TagthValidationError,
+    compile_resource,
+)
+
+# Layout, all integers little-endian unsigned 16-bit words:
+#
+#   magic b'TGR', version byte, word count
+#   the words: string count, the length of every string in characters, tag count, then per tag
+#       the tag string index, the action count and the action string indexes
+#   the UTF-8 blob of all strings concatenated, up to the end of the data
+#
+# Tags and actions share one string table, so each distinct string is stored once. Decoding
+# takes one unpack of the header, one of all words and one UTF-8 decode of the blob. Decoded
+# data is held to the grammar: every string is an identifier, except the `@empty` tag, which
+# only grants `all`, and every tag has at least one action.
+MAGIC = b'TGR'
+VERSION = 1
+
+_HEADER = struct.Struct('<3sBH')
+_WORD_SIZE = 2
+_WORD_MAX = 0xFFFF
+
+_IDENT = re.compile(_IDENT_PATTERN)
+
+
+def encode_resource(resource: Union[str, CompiledResource]) -> bytes:
+    """Encodes a resource ACL into the compact binary form.
+
+    Args:
+        resource (str | CompiledResource): A string representing the pairs of tags and actions.
+
+    Returns:
+        bytes: The versioned binary encoding of the normalized ACL.
+    """
+    items = list(compile_resource(resource)._items())
+    strings = {}
+    groups = [len(items)]
+
+    for (res_tag, tag_actions) in items:
+        groups.append(strings.setdefault(res_tag, len(strings)))
+        groups.append(len(tag_actions))
+        groups.extend(strings.setdefault(action, len(strings)) for action in tag_actions)
+
+    words = [len(strings)] + [len(string) for string in strings] + groups
+
+    if len(words) > _WORD_MAX or any(word > _WORD_MAX for word in words):
+        raise ValueError('Resource too large to encode')
+
+    return _HEADER.pack(MAGIC, VERSION, len(words)) + struct.pack(f'<{len(words)}H', *words) + ''.join(strings).encode('utf-8')
+
+
+def _decode(data: Union[bytes, bytearray, memoryview]) -> tuple[list[str], tuple[int, ...]]:
+    # Returns the string table and the words, reading the buffer in place; only the strings are
+    # materialized.
+    view = memoryview(data)
+
+    try:
+        magic, version, word_count = _HEADER.unpack_from(view, 0)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError
+
+        words = struct.unpack_from(f'<{word_count}H', view, _HEADER.size)
+        blob = str(view[_HEADER.size + word_count * _WORD_SIZE:], 'utf-8')
+        string_count = words[0]
+        strings = []
+        start = 0
+
+        for length in words[1:string_count + 1]:
+            strings.append(blob[start:start + length])
+            start += length
+
+        if start != len(blob) or len(strings) != string_count:
+            raise ValueError
+
+        for string in strings:
+            if string != EMPTY_RESOURCE_TAG and not _IDENT.fullmatch(string):
+                raise ValueError
+    except (ValueError, IndexError, struct.error):
+        raise _invalid() from None
+
+    return strings, words
+
+
+def _invalid() -> TagthValidationError:
+    return TagthValidationError('Invalid binary resource')
+
+
+def _groups(strings: list[str], words: tuple[int, ...], values: list):
+    # Maps the tag and action indexes of every tag through `values`, the string table or the
+    # symbol IDs of its strings. The caller turns the IndexError of a truncated group, an index
+    # out of the table or a group the grammar cannot produce into a validation error.
+    position = len(strings) + 2
+    empty = {index for (index, string) in enumerate(strings) if string == EMPTY_RESOURCE_TAG}
+
+    for _ in range(words[position - 1]):
+        action_count = words[position + 1]
+        end = position + 2 + action_count
+        action_indexes = words[position + 2:end]
+
+        if end > len(words) or not action_count:
+            raise IndexError
+
+        if empty:
+            if words[position] in empty:
+                if [strings[index] for index in action_indexes] != [FULL_ACCESS_ACTION]:
+                    raise IndexError
+            elif not empty.isdisjoint(action_indexes):
+                raise IndexError
+
+        yield values[words[position]], [values[index] for index in action_indexes]
+        position = end
+
+    if position != len(words):
+        raise IndexError
+
+
+def decode_pairs(data: Union[bytes, bytearray, memoryview]) -> list[tuple[str, str]]:
+    """Decodes the (tag, action) pairs of a binary ACL.
+
+    Args:
+        data (bytes | bytearray | memoryview): The binary encoding.
+
+    Returns:
+        list[tuple[str, str]]: The normalized pairs of the ACL.
+
+    Raises:
+        TagthValidationError: If the data is not a valid binary ACL.
+    """
+    strings, words = _decode(data)
+
+    try:
+        return [(res_tag, action) for (res_tag, actions) in _groups(strings, words, strings) for action in actions]
+    except IndexError:
+        raise _invalid() from None
+
+
+def decode_resource(data: Union[bytes, bytearray, memoryview]) -> CompiledResource:
+    """Decodes a binary ACL into a compiled resource, without parsing the string form.
+
+    Every distinct string is interned once and the resource is built from the interned IDs.
+
+    Args:
+        data (bytes | bytearray | memoryview): The binary encoding.
+
+    Returns:
+        CompiledResource: The compiled resource, usable wherever a resource string is accepted.
+
+    Raises:
+        TagthValidationError: If the data is not a valid binary ACL.
+    """
+    strings, words = _decode(data)
+    intern = SYMBOLS.intern
+    grouped = {}
+
+    try:
+        for (tag_id, action_ids) in _groups(strings, words, [intern(string) for string in strings]):
+            grouped.setdefault(tag_id, set()).update(action_ids)
+    except IndexError:
+        raise _invalid() from None
+
+    return CompiledResource._from_ids(grouped)
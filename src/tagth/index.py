@@ -0,0 +1,275 @@
+from bisect import bisect_left, insort
+from typing import Hashable, Iterable, Union
+
+from .tagth import (
+    ANYONE_PRINCIPAL,
+    FULL_ACCESS_ACTION,
+    CompiledPrincipal,
+    CompiledResource,
+    TagthValidationError,
+    _grants,
+    _load_resource,
+    _query_principal,
+    compile_principal,
+    compile_resource,
+)
+from .universe import _prefix_range
+
+
+def _granting_actions(action: str) -> list[str]:
+    # The granted actions that `_grants()` accepts for `action`: `all` and every prefix of the
+    # action, except that `all` itself is only granted by `all`.
+    if action == FULL_ACCESS_ACTION:
+        return [FULL_ACCESS_ACTION]
+
+    return [FULL_ACCESS_ACTION] + [action[:end] for end in range(1, len(action) + 1)]
+
+
+class _Postings:
+    """Sets of IDs keyed by tag, with the tags kept sorted for prefix range scans."""
+
+    __slots__ = ('tags', 'ids')
+
+    def __init__(self):
+        self.tags = []
+        self.ids = {}
+
+    def add(self, tag: str, item_id) -> None:
+        ids = self.ids.get(tag)
+
+        if ids is None:
+            ids = self.ids[tag] = set()
+            insort(self.tags, tag)
+
+        ids.add(item_id)
+
+    def discard(self, tag: str, item_id) -> None:
+        ids = self.ids.get(tag)
+
+        if ids is None:
+            return
+
+        ids.discard(item_id)
+
+        if not ids:
+            del self.ids[tag]
+            del self.tags[bisect_left(self.tags, tag)]
+
+    def get(self, tag: str) -> set:
+        return self.ids.get(tag, ())
+
+    def prefixed(self, prefix: str):
+        """Yields the ID sets of all tags that start with `prefix`."""
+        low, high = _prefix_range(self.tags, prefix)
+        ids = self.ids
+
+        for tag in self.tags[low:high]:
+            yield ids[tag]
+
+    def __bool__(self):
+        return bool(self.ids)
+
+
+class ResourceIndex:
+    """An inverted index of resource ACLs for listing the resources a principal may act on.
+
+    Every (resource tag, action) pair of every ACL is posted under its action and tag. A query
+    only visits the actions that grant the requested one (`all` and its prefixes) and, within
+    them, the `anyone` tag and the sorted run of tags under each supertag of the principal, so
+    its cost depends on the matching postings rather than on the number of resources. Results
+    match `allowed()` exactly: root principals get every resource, void and empty ACLs grant
+    nothing to anyone else.
+
+    Args:
+        resources (Iterable[tuple[Hashable, str | CompiledResource]]): Initial resource IDs and ACLs.
+    """
+
+    def __init__(self, resources: Iterable[tuple[Hashable, Union[str, CompiledResource]]] = ()):
+        self._resources = {}
+        self._postings = {}
+
+        for (resource_id, resource) in resources:
+            self.add(resource_id, resource)
+
+    def add(self, resource_id: Hashable, resource: Union[str, CompiledResource]) -> None:
+        """Indexes a resource ACL, replacing the previous ACL of the same resource ID.
+
+        Args:
+            resource_id (Hashable): The ID of the resource.
+            resource (str | CompiledResource): The ACL of the resource.
+        """
+        resource = compile_resource(resource)
+
+        if resource_id in self._resources:
+            self.remove(resource_id)
+
+        self._resources[resource_id] = resource
+
+        for (res_tag, tag_actions) in resource._items():
+            for action in tag_actions:
+                postings = self._postings.get(action)
+                if postings is None:
+                    postings = self._postings[action] = _Postings()
+                postings.add(res_tag, resource_id)
+
+    def remove(self, resource_id: Hashable) -> None:
+        """Removes a resource from the index.
+
+        Args:
+            resource_id (Hashable): The ID of the resource.
+
+        Raises:
+            KeyError: If the resource is not indexed.
+        """
+        resource = self._resources.pop(resource_id)
+
+        for (res_tag, tag_actions) in resource._items():
+            for action in tag_actions:
+                postings = self._postings[action]
+                postings.discard(res_tag, resource_id)
+                if not postings:
+                    del self._postings[action]
+
+    def allowed(self, principal: Union[str, CompiledPrincipal], action: str) -> set:
+        """Finds the resources on which a principal may perform an action.
+
+        Args:
+            principal (str | CompiledPrincipal): The principal tags, or a compiled principal.
+            action (str): The action to check for permission.
+
+        Returns:
+            set: The IDs of the resources for which `allowed()` returns True.
+        """
+        if not isinstance(action, str):
+            raise TagthValidationError('Bad action: expected a string')
+
+        principal = _query_principal(principal)
+
+        if principal.is_root:
+            return set(self._resources)
+
+        found = set()
+
+        for granted in _granting_actions(action):
+            postings = self._postings.get(granted)
+
+            if postings is None:
+                continue
+
+            found.update(postings.get(ANYONE_PRINCIPAL))
+
+            for supertag in principal._supertags:
+                for ids in postings.prefixed(supertag):
+                    found.update(ids)
+
+        return found
+
+    def __contains__(self, resource_id):
+        return resource_id in self._resources
+
+    def __len__(self):
+        return len(self._resources)
+
+
+class PrincipalIndex:
+    """A reverse index of principals for finding who may perform an action on a resource.
+
+    Principals are posted under each of their tags. A principal possesses a resource tag if one
+    of its tags is a prefix of it, so a query looks up every prefix of each resource tag that
+    grants the action; its cost depends on the length of the granting tags and the matching
+    postings rather than on the number of principals. Root principals are always allowed and an
+    `anyone` grant allows every principal, both without visiting any tag postings. Results
+    match `allowed()` exactly.
+
+    Args:
+        principals (Iterable[tuple[Hashable, str | CompiledPrincipal]]): Initial principal IDs and tags.
+    """
+
+    def __init__(self, principals: Iterable[tuple[Hashable, Union[str, CompiledPrincipal]]] = ()):
+        self._principals = {}
+        self._postings = {}
+        self._roots = set()
+
+        for (principal_id, principal) in principals:
+            self.add(principal_id, principal)
+
+    def add(self, principal_id: Hashable, principal: Union[str, CompiledPrincipal]) -> None:
+        """Indexes a principal, replacing the previous tags of the same principal ID.
+
+        Args:
+            principal_id (Hashable): The ID of the principal.
+            principal (str | CompiledPrincipal): The tags of the principal.
+        """
+        principal = compile_principal(principal)
+
+        if principal_id in self._principals:
+            self.remove(principal_id)
+
+        self._principals[principal_id] = principal
+
+        if principal.is_root:
+            self._roots.add(principal_id)
+            return
+
+        for tag in principal.tags:
+            self._postings.setdefault(tag, set()).add(principal_id)
+
+    def remove(self, principal_id: Hashable) -> None:
+        """Removes a principal from the index.
+
+        Args:
+            principal_id (Hashable): The ID of the principal.
+
+        Raises:
+            KeyError: If the principal is not indexed.
+        """
+        principal = self._principals.pop(principal_id)
+
+        if principal.is_root:
+            self._roots.discard(principal_id)
+            return
+
+        for tag in principal.tags:
+            ids = self._postings[tag]
+            ids.discard(principal_id)
+            if not ids:
+                del self._postings[tag]
+
+    def allowed(self, resource: Union[str, CompiledResource], action: str) -> set:
+        """Finds the principals that may perform an action on a resource.
+
+        Args:
+            resource (str | CompiledResource): The resource ACL, or a compiled resource.
+            action (str): The action to check for permission.
+
+        Returns:
+            set: The IDs of the principals for which `allowed()` returns True.
+        """
+        if not isinstance(action, str):
+            raise TagthValidationError('Bad action: expected a string')
+
+        # A resource string is evaluated from its pairs, without interning its tags and actions.
+        resource = _load_resource(resource)
+        items = resource._table if isinstance(resource, CompiledResource) else ((res_tag, (granted,)) for (res_tag, granted) in resource)
+        found = set(self._roots)
+        postings = self._postings
+
+        for (res_tag, tag_actions) in items:
+            if not any(_grants(granted, action) for granted in tag_actions):
+                continue
+
+            if res_tag == ANYONE_PRINCIPAL:
+                return set(self._principals)
+
+            for end in range(1, len(res_tag) + 1):
+                ids = postings.get(res_tag[:end])
+                if ids:
+                    found.update(ids)
+
+        return found
+
+    def __contains__(self, principal_id):
+        return principal_id in self._principals
+
+    def __len__(self):
+        return len(self._principals)
@@ -0,0 +1,146 @@
+from typing import Iterator, Sequence, Union
+
+from .cache import LRUCache
+from .tagth import (
+    ANYONE_PRINCIPAL,
+    EMPTY_RESOURCE_TAG,
+    CompiledResource,
+    TagthValidationError,
+    _grants,
+    _load_resource,
+    _query_principal,
+)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('tagth.matrix requires numpy') from None
+
+    return numpy
+
+
+def _unique(values: Sequence) -> tuple[list, list[int]]:
+    index = {}
+    inverse = [index.setdefault(value, len(index)) for value in values]
+    return list(index), inverse
+
+
+# The number of resources whose granting tags are remembered across chunks, so ACLs repeated
+# all over the input are not parsed again in every chunk.
+_GRANTING_CACHE_ENTRIES = 4096
+
+
+def _granting_tags(resource: Union[str, CompiledResource], action: str) -> set[str]:
+    # The resource tags of the pairs granting the action; only these decide the outcome.
+    resource = _load_resource(resource)
+    pairs = resource.pairs if isinstance(resource, CompiledResource) else resource
+    return {res_tag for (res_tag, granted) in pairs if res_tag != EMPTY_RESOURCE_TAG and _grants(granted, action)}
+
+
+def _blocks(principals: Sequence[str], resources: Sequence[str], action: str, chunk_size: int):
+    # Yields (offset, block) pairs, where `block` is the boolean permission matrix of all
+    # principals against `chunk_size` consecutive resources starting at `offset`.
+    np = _numpy()
+
+    if not isinstance(action, str):
+        raise TagthValidationError('Bad action: expected a string')
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+
+    unique_principals, principal_inverse = _unique(principals)
+    compiled_principals = [_query_principal(p) for p in unique_principals]
+
+    # Principal rows posted under each of their minimal supertags: a resource tag is covered by
+    # the rows posted under any of its prefixes, of which only the posted lengths are looked up.
+    postings = {}
+    for row, principal in enumerate(compiled_principals):
+        for supertag in principal._supertags:
+            postings.setdefault(supertag, []).append(row)
+    lengths = sorted({len(supertag) for supertag in postings})
+
+    roots = np.array([principal.is_root for principal in compiled_principals], dtype=bool)
+    principal_inverse = np.array(principal_inverse, dtype=np.intp)
+    granting_cache = LRUCache(lambda resource: _granting_tags(resource, action), TagthValidationError, _GRANTING_CACHE_ENTRIES)
+
+    for offset in range(0, len(resources), chunk_size):
+        chunk, chunk_inverse = _unique(resources[offset:offset + chunk_size])
+        granting = [granting_cache.get(resource) for resource in chunk]
+
+        # The vocabulary and the coverage columns only span the granting tags of this chunk, so
+        # memory is bounded by the principals times the chunk, whatever the number of resources.
+        vocabulary = sorted(set().union(*granting))
+        columns = {res_tag: column for column, res_tag in enumerate(vocabulary)}
+
+        covered_rows, covered_columns = [], []
+        for column, res_tag in enumerate(vocabulary):
+            for end in lengths:
+                if end > len(res_tag):
+                    break
+                rows = postings.get(res_tag[:end])
+                if rows is not None:
+                    covered_rows.extend(rows)
+                    covered_columns.extend([column] * len(rows))
+
+        coverage = np.zeros((len(compiled_principals), len(vocabulary)), dtype=np.float32)
+        coverage[covered_rows, covered_columns] = 1
+        if ANYONE_PRINCIPAL in columns:
+            coverage[:, columns[ANYONE_PRINCIPAL]] = 1
+
+        grants = np.zeros((len(vocabulary), len(chunk)), dtype=np.float32)
+        for column, tags in enumerate(granting):
+            grants[[columns[res_tag] for res_tag in tags], column] = 1
+
+        block = np.matmul(coverage, grants) > 0
+        block[roots] = True
+        yield offset, block[principal_inverse][:, chunk_inverse]
+
+
+def permission_matrix(principals: Sequence[str], resources: Sequence[str], action: str, chunk_size: int = 1024):
+    """Evaluates an action for every principal against every resource.
+
+    Decisions are computed as matrix products over the tags granting the action, `chunk_size`
+    resources at a time; each distinct resource in a chunk is evaluated once. Apart from the
+    result, memory is bounded by the principals times the granting tags of one chunk. Requires
+    numpy.
+
+    Args:
+        principals (Sequence[str]): The principal strings (rows).
+        resources (Sequence[str]): The resource strings (columns).
+        action (str): The action to check for permission.
+        chunk_size (int): The number of resources evaluated at once.
+
+    Returns:
+        numpy.ndarray: A boolean matrix; `[i, j]` is True if principal `i` may act on resource `j`.
+    """
+    np = _numpy()
+    matrix = np.zeros((len(principals), len(resources)), dtype=bool)
+
+    for offset, block in _blocks(principals, resources, action, chunk_size):
+        matrix[:, offset:offset + block.shape[1]] = block
+
+    return matrix
+
+
+def allowed_pairs(principals: Sequence[str], resources: Sequence[str], action: str, chunk_size: int = 1024) -> Iterator[tuple[int, int]]:
+    """Lazily yields the (principal index, resource index) pairs for which the action is allowed.
+
+    Memory is bounded by the principals times the granting tags of one chunk of `chunk_size`
+    resources, however many resources there are. Requires numpy.
+
+    Args:
+        principals (Sequence[str]): The principal strings.
+        resources (Sequence[str]): The resource strings.
+        action (str): The action to check for permission.
+        chunk_size (int): The number of resources evaluated at once.
+
+    Returns:
+        Iterator[tuple[int, int]]: The allowed pairs, ordered by resource chunk and then by principal.
+    """
+    np = _numpy()
+
+    for offset, block in _blocks(principals, resources, action, chunk_size):
+        rows, columns = np.nonzero(block)
+        for row, column in zip(rows.tolist(), (columns + offset).tolist()):
+            yield row, column
@@ -0,0 +1,410 @@
+import os
+import struct
+from typing import Iterable, Optional, Union
+
+from .symbols import SYMBOLS
+from .tagth import (
+    CompiledPrincipal,
+    CompiledResource,
+    TagthValidationError,
+    _allowed_internal,
+    _load_resource,
+    _query_principal,
+    compile_principal,
+    compile_resource,
+)
+
+# Layout, all integers little-endian:
+#
+#   header: magic b'TGS', version byte, string count, principal slot count, resource slot count (u32)
+#   string table: string count + 1 byte offsets into the string blob (u32)
+#   principal slots: key hash (u64) and entry offset (u32) per slot, an offset of 0 marks a free slot
+#   resource slots: likewise
+#   string blob: the UTF-8 strings of all tags and actions, concatenated
+#   entries: key length (u32), key bytes, word count (u32), words (u32)
+#
+# The slots form an open addressing hash table with linear probing, at most half full, over the
+# key hashes. Keys are hashed with BLAKE2b, which unlike `hash()` is stable across processes; the
+# key itself is stored in the entry to rule out collisions. Principal entry words are the string
+# indexes of its tags. Resource entry words are the tag count, the tag string indexes, the
+# offsets of every tag's actions and the action string indexes.
+MAGIC = b'TGS'
+VERSION = 1
+
+_HEADER = struct.Struct('<3sB3I')
+_U32 = struct.Struct('<I')
+_SLOT = struct.Struct('<QI')
+
+
+def _key(string: str) -> bytes:
+    return string.encode('utf-8', 'surrogatepass')
+
+
+def _hash(key: bytes) -> int:
+    # hashlib, like mmap and tempfile below, is imported on first use to keep `import tagth` fast.
+    from hashlib import blake2b
+
+    return int.from_bytes(blake2b(key, digest_size=8).digest(), 'little')
+
+
+class _Builder:
+    def __init__(self):
+        self.strings = {}
+
+    def intern(self, string: str) -> int:
+        return self.strings.setdefault(string, len(self.strings))
+
+    def principal(self, principal: CompiledPrincipal) -> list[int]:
+        return [self.intern(tag) for tag in sorted(principal.tags)]
+
+    def resource(self, resource: CompiledResource) -> list[int]:
+        items = list(resource._items())
+        offsets = [0]
+        action_indexes = []
+
+        for (_, tag_actions) in items:
+            action_indexes.extend(self.intern(action) for action in tag_actions)
+            offsets.append(len(action_indexes))
+
+        return [len(items)] + [self.intern(res_tag) for (res_tag, _) in items] + offsets + action_indexes
+
+
+def _entry(key: bytes, words: list[int]) -> bytes:
+    return _U32.pack(len(key)) + key + _U32.pack(len(words)) + struct.pack(f'<{len(words)}I', *words)
+
+
+def _invalid() -> TagthValidationError:
+    return TagthValidationError('Invalid snapshot')
+
+
+def _umask() -> int:
+    # The umask can only be read by setting it, so it is set back straight away.
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+def _slot_count(entries: int) -> int:
+    return 1 << (2 * entries - 1).bit_length() if entries else 0
+
+
+def write_snapshot(path: Union[str, os.PathLike], principals: Iterable[str] = (), resources: Iterable[str] = ()) -> None:
+    """Precompiles principal and resource strings into a snapshot file for `PolicySnapshot`.
+
+    The file is written next to `path` and then moved into place, so processes that have the
+    previous snapshot mapped keep reading a consistent file.
+
+    Args:
+        path (str | PathLike): The snapshot file.
+        principals (Iterable[str]): The principal strings to precompile.
+        resources (Iterable[str]): The resource strings to precompile.
+
+    Raises:
+        TagthValidationError: If any of the strings is invalid.
+    """
+    builder = _Builder()
+    sections = []
+
+    for (strings, compile_function, encode) in ((principals, compile_principal, builder.principal), (resources, compile_resource, builder.resource)):
+        entries = {}
+
+        for string in strings:
+            key = _key(string)
+            if key not in entries:
+                entries[key] = _entry(key, encode(compile_function(string)))
+
+        sections.append(entries)
+
+    blob = ''.join(builder.strings).encode('utf-8', 'surrogatepass')
+    string_offsets = [0]
+
+    for string in builder.strings:
+        string_offsets.append(string_offsets[-1] + len(_key(string)))
+
+    slot_counts = [_slot_count(len(entries)) for entries in sections]
+    offset = _HEADER.size + _U32.size * len(string_offsets) + _SLOT.size * sum(slot_counts) + len(blob)
+    tables = []
+
+    for (entries, slot_count) in zip(sections, slot_counts):
+        slots = [(0, 0)] * slot_count
+        mask = slot_count - 1
+
+        for (key, entry) in entries.items():
+            key_hash = _hash(key)
+            position = key_hash & mask
+
+            while slots[position][1]:
+                position = (position + 1) & mask
+
+            slots[position] = (key_hash, offset)
+            offset += len(entry)
+
+        tables.append(b''.join(_SLOT.pack(*slot) for slot in slots))
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, len(builder.strings), *slot_counts),
+        struct.pack(f'<{len(string_offsets)}I', *string_offsets),
+        *tables,
+        blob,
+        *(entry for entries in sections for entry in entries.values()),
+    ]
+
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, prefix='.tagth-snapshot-')
+
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            file.writelines(parts)
+        # mkstemp() creates the file readable by its owner only; give it the mode open() would.
+        os.chmod(temporary, 0o666 & ~_umask())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+class PolicySnapshot:
+    """A read-only, memory-mapped snapshot of precompiled principals and resources.
+
+    Every process maps the same file, so the operating system shares its pages between them
+    instead of each process holding its own parsed copies. Entries are found in place through a
+    hash table of stable key hashes and decoded on demand, and their tags and actions are interned
+    only when an entry that uses them is loaded; strings missing from the snapshot are compiled
+    as usual. Decisions match `allowed()` exactly.
+
+    Args:
+        path (str | PathLike): A snapshot file written by `write_snapshot()`.
+
+    Raises:
+        TagthValidationError: If the file is not a valid snapshot.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        import mmap
+
+        with open(path, 'rb') as file:
+            try:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise _invalid() from None
+
+        view = self._view = memoryview(self._mmap)
+
+        try:
+            magic, version, string_count, principal_slots, resource_slots = _HEADER.unpack_from(view, 0)
+            offset = _HEADER.size + _U32.size * (string_count + 1)
+            self._principals = (offset, principal_slots)
+            offset += _SLOT.size * principal_slots
+            self._resources = (offset, resource_slots)
+            offset += _SLOT.size * resource_slots
+
+            # Slot counts are powers of two, so the hash is reduced with a mask.
+            power_of_two = not (principal_slots & (principal_slots - 1) or resource_slots & (resource_slots - 1))
+
+            if magic != MAGIC or version != VERSION or len(view) < offset or not power_of_two:
+                raise ValueError
+
+            (blob_size,) = _U32.unpack_from(view, _HEADER.size + _U32.size * string_count)
+            self._strings = (string_count, offset)
+            self._entries = offset + blob_size
+
+            if len(view) < self._entries:
+                raise ValueError
+        except (ValueError, struct.error):
+            self.close()
+            raise _invalid() from None
+
+        # Strings are interned as entries that use them are loaded, so a process only adds the
+        # tags and actions it actually checks to its symbol table.
+        self._symbol_ids = {}
+
+    def _symbol_id(self, index: int) -> int:
+        symbol_id = self._symbol_ids.get(index)
+
+        if symbol_id is None:
+            string_count, blob = self._strings
+
+            if index >= string_count:
+                raise IndexError
+
+            start, end = struct.unpack_from('<2I', self._view, _HEADER.size + _U32.size * index)
+
+            if not start <= end <= self._entries - blob:
+                raise ValueError
+
+            string = str(self._view[blob + start:blob + end], 'utf-8', 'surrogatepass')
+            symbol_id = self._symbol_ids[index] = SYMBOLS.intern(string)
+
+        return symbol_id
+
+    def _symbol_ids_of(self, indexes: tuple[int, ...]) -> list[int]:
+        symbol_ids = self._symbol_ids
+        return [symbol_ids[index] if index in symbol_ids else self._symbol_id(index) for index in indexes]
+
+    def _find(self, table: tuple[int, int], string: str) -> Optional[tuple[int, ...]]:
+        # Returns the words of the entry for `string`, or None. Offsets read from the file are
+        # checked against its size, so a corrupt file fails with the generic validation error.
+        start, slot_count = table
+
+        if not slot_count:
+            return None
+
+        key = _key(string)
+        key_hash = _hash(key)
+        mask = slot_count - 1
+        position = key_hash & mask
+        view = self._view
+        size = len(view)
+
+        for _ in range(slot_count):
+            slot_hash, entry = _SLOT.unpack_from(view, start + position * _SLOT.size)
+
+            if not entry:
+                return None
+
+            if slot_hash == key_hash:
+                if not self._entries <= entry <= size - _U32.size:
+                    raise _invalid()
+
+                (key_length,) = _U32.unpack_from(view, entry)
+                entry += _U32.size
+
+                if key_length > size - entry:
+                    raise _invalid()
+
+                if view[entry:entry + key_length] == key:
+                    entry += key_length
+
+                    if entry > size - _U32.size:
+                        raise _invalid()
+
+                    (word_count,) = _U32.unpack_from(view, entry)
+                    entry += _U32.size
+
+                    if word_count > (size - entry) // _U32.size:
+                        raise _invalid()
+
+                    return struct.unpack_from(f'<{word_count}I', view, entry)
+
+            position = (position + 1) & mask
+
+        return None
+
+    def principal(self, principal: Union[str, CompiledPrincipal]) -> CompiledPrincipal:
+        """Loads a principal from the snapshot, or compiles it if it is not in the snapshot.
+
+        Args:
+            principal (str | CompiledPrincipal): A string representing the principal tags.
+
+        Returns:
+            CompiledPrincipal: The compiled principal.
+
+        Raises:
+            TagthValidationError: If the principal is invalid, or its entry in the snapshot is corrupt.
+        """
+        if isinstance(principal, str):
+            stored = self._stored_principal(principal)
+
+            if stored is not None:
+                return stored
+
+        return compile_principal(principal)
+
+    def _stored_principal(self, principal: str) -> Optional[CompiledPrincipal]:
+        words = self._find(self._principals, principal)
+
+        if words is None:
+            return None
+
+        try:
+            return CompiledPrincipal._from_ids(self._symbol_ids_of(words))
+        except (ValueError, IndexError, struct.error):
+            raise _invalid() from None
+
+    def resource(self, resource: Union[str, CompiledResource]) -> CompiledResource:
+        """Loads a resource from the snapshot, or compiles it if it is not in the snapshot.
+
+        Args:
+            resource (str | CompiledResource): A string representing the pairs of tags and actions.
+
+        Returns:
+            CompiledResource: The compiled resource.
+
+        Raises:
+            TagthValidationError: If the resource is invalid, or its entry in the snapshot is corrupt.
+        """
+        if isinstance(resource, str):
+            stored = self._stored_resource(resource)
+
+            if stored is not None:
+                return stored
+
+        return compile_resource(resource)
+
+    def _stored_resource(self, resource: str) -> Optional[CompiledResource]:
+        words = self._find(self._resources, resource)
+
+        if words is None:
+            return None
+
+        try:
+            return CompiledResource._from_ids(self._group(words))
+        except (ValueError, IndexError, struct.error):
+            raise _invalid() from None
+
+    def _group(self, words: tuple[int, ...]) -> dict[int, set[int]]:
+        # Maps the tag IDs of a resource entry to the sets of their action IDs.
+        tag_count = words[0]
+        actions_start = 2 * tag_count + 2
+        offsets = words[tag_count + 1:actions_start]
+
+        if len(offsets) != tag_count + 1 or offsets[0] or offsets[-1] != len(words) - actions_start:
+            raise ValueError
+
+        action_ids = self._symbol_ids_of(words[actions_start:])
+        grouped = {}
+
+        for (position, tag_id) in enumerate(self._symbol_ids_of(words[1:tag_count + 1])):
+            if offsets[position] > offsets[position + 1]:
+                raise ValueError
+
+            grouped.setdefault(tag_id, set()).update(action_ids[offsets[position]:offsets[position + 1]])
+
+        return grouped
+
+    def allowed(self, principal: Union[str, CompiledPrincipal], resource: Union[str, CompiledResource], action: str) -> bool:
+        """Checks if a principal is allowed to perform an action on a resource, like `allowed()`.
+
+        Args:
+            principal (str | CompiledPrincipal): The principal tags, or a compiled principal.
+            resource (str | CompiledResource): The resource ACL, or a compiled resource.
+            action (str): The action to check for permission.
+
+        Returns:
+            bool: True if the action is allowed, False otherwise.
+        """
+        if not isinstance(action, str):
+            raise TagthValidationError('Bad action: expected a string')
+
+        # Strings missing from the snapshot are checked without interning, like `allowed()`.
+        stored_principal = self._stored_principal(principal) if isinstance(principal, str) else None
+        stored_resource = self._stored_resource(resource) if isinstance(resource, str) else None
+
+        return _allowed_internal(
+            _query_principal(principal) if stored_principal is None else stored_principal,
+            _load_resource(resource) if stored_resource is None else stored_resource,
+            action,
+        )
+
+    def close(self) -> None:
+        """Unmaps the snapshot file."""
+        self._view.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,93 @@
+import re
+import sys
+from typing import Hashable, Union
+
+from .index import _granting_actions
+from .tagth import ANYONE_PRINCIPAL, CompiledPrincipal, CompiledResource, TagthValidationError, _query_principal, compile_resource
+
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)?')
+
+
+def _identifier(name: str) -> str:
+    # Table and column names cannot be bound as parameters, so only plain identifiers are accepted.
+    if not isinstance(name, str) or not _IDENTIFIER.fullmatch(name):
+        raise ValueError('Invalid SQL identifier')
+
+    return name
+
+
+def acl_rows(resource_id: Hashable, resource: Union[str, CompiledResource]) -> list[tuple[Hashable, str, str]]:
+    """Normalizes a resource ACL into rows of the side table queried by `sql_predicate()`.
+
+    The void resource has no rows; an empty resource has a single `@empty` row that grants
+    nothing to non-root principals.
+
+    Args:
+        resource_id (Hashable): The ID of the resource.
+        resource (str | CompiledResource): The ACL of the resource.
+
+    Returns:
+        list[tuple[Hashable, str, str]]: The (resource ID, tag, action) rows, sorted by tag and action.
+    """
+    return [(resource_id, res_tag, action) for (res_tag, action) in sorted(compile_resource(resource).pairs)]
+
+
+def sql_predicate(
+    principal: Union[str, CompiledPrincipal],
+    action: str,
+    id_column: str = 'id',
+    table: str = 'resource_acl',
+    resource_id_column: str = 'resource_id',
+    tag_column: str = 'tag',
+    action_column: str = 'action',
+) -> tuple[str, list[str]]:
+    """Builds a parameterized SQL predicate that selects the resources a principal may act on.
+
+    The predicate applies to the resource table and looks up a side table of (resource ID, tag,
+    action) rows, as produced by `acl_rows()`. It accepts the actions that grant `action` (`all`
+    and its prefixes) on the `anyone` tag and on every tag in the range under a supertag of the
+    principal, so an index on (action, tag) serves the lookup. Results match `allowed()` provided
+    the tag column compares strings by code point, e.g. the default `BINARY` collation of SQLite.
+
+    Args:
+        principal (str | CompiledPrincipal): The principal tags, or a compiled principal.
+        action (str): The action to check for permission.
+        id_column (str): The resource ID column of the queried table.
+        table (str): The side table of ACL rows.
+        resource_id_column (str): The resource ID column of the side table.
+        tag_column (str): The tag column of the side table.
+        action_column (str): The action column of the side table.
+
+    Returns:
+        tuple[str, list[str]]: The predicate with `?` placeholders and its parameters.
+    """
+    if not isinstance(action, str):
+        raise TagthValidationError('Bad action: expected a string')
+
+    names = [_identifier(name) for name in (id_column, table, resource_id_column, tag_column, action_column)]
+    id_column, table, resource_id_column, tag_column, action_column = names
+    principal = _query_principal(principal)
+
+    if principal.is_root:
+        return '1 = 1', []
+
+    granting = list(dict.fromkeys(_granting_actions(action)))
+    tag_terms = [f'{tag_column} = ?']
+    params = granting + [ANYONE_PRINCIPAL]
+
+    for supertag in principal._supertags:
+        last = ord(supertag[-1])
+
+        if last < sys.maxunicode:
+            tag_terms.append(f'({tag_column} >= ? AND {tag_column} < ?)')
+            params.extend((supertag, supertag[:-1] + chr(last + 1)))
+        else:
+            tag_terms.append(f'substr({tag_column}, 1, ?) = ?')
+            params.extend((len(supertag), supertag))
+
+    placeholders = ', '.join('?' * len(granting))
+    predicate = (
+        f'{id_column} IN (SELECT {resource_id_column} FROM {table} '
+        f'WHERE {action_column} IN ({placeholders}) AND ({" OR ".join(tag_terms)}))'
+    )
+    return predicate, params
@@ -0,0 +1,57 @@
+import threading
+from typing import Optional
+
+
+class SymbolTable:
+    """An append-only table interning tag and action strings to small integer IDs.
+
+    Every distinct string is stored once and keeps its ID for the lifetime of the table, so
+    compiled principals and resources can hold compact integer arrays instead of strings.
+    Lookups are lock-free; only adding a new symbol takes a lock.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._lock = threading.Lock()
+        self.strings = []
+
+    def intern(self, symbol: str) -> int:
+        """Returns the ID of a symbol, adding it to the table if needed.
+
+        Args:
+            symbol (str): The tag or action to intern.
+
+        Returns:
+            int: The ID of the symbol.
+        """
+        symbol_id = self._ids.get(symbol)
+
+        if symbol_id is None:
+            with self._lock:
+                symbol_id = self._ids.get(symbol)
+
+                if symbol_id is None:
+                    # Publish the string before its ID, so readers that see the ID can resolve it.
+                    symbol_id = len(self.strings)
+                    self.strings.append(symbol)
+                    self._ids[symbol] = symbol_id
+
+        return symbol_id
+
+    def get(self, symbol: str) -> Optional[int]:
+        """Returns the ID of a symbol, or None if it was never interned."""
+        return self._ids.get(symbol)
+
+    def symbol(self, symbol_id: int) -> str:
+        """Returns the interned string with the given ID."""
+        return self.strings[symbol_id]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._ids
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+# The process-wide table used by `compile_principal()` and `compile_resource()`.
+SYMBOLS = SymbolTable()
@@ -1,15 +1,12 @@
-from pyparsing import (
-    Empty,
-    Literal,
-    ParseException,
-    StringEnd,
-    Suppress,
-    Word,
-    ZeroOrMore,
-    delimitedList,
-    identbodychars,
-    identchars,
-)
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from .cache import CacheStats, LRUCache
+from .symbols import SYMBOLS
 
 TAG_LIST_DELIMETER = ','
 ACTION_DELIMETER = ':'
@@ -21,6 +18,11 @@ EMPTY_RESOURCE_TAG = '@empty'
 VOID_RESOURCE = ''
 BRACE_OPEN = '{'
 BRACE_CLOSE = '}'
+PARSE_ENGINE_SCANNER = 'scanner'
+PARSE_ENGINE_PYPARSING = 'pyparsing'
+VALIDATION_BAD_TYPE = 'bad_type'
+VALIDATION_BAD_FORMAT = 'bad_format'
+VALIDATION_TOO_LARGE = 'too_large'
 
 
 class TagthException(Exception):
@@ -31,9 +33,8 @@ class TagthValidationError(TagthException):
     pass
 
 
-def _normalize_principal(principal: str) -> list[str]:
-    if not isinstance(principal, str):
-        raise TagthValidationError('Bad principal: expected a string')
+def _build_principal_parser():
+    from pyparsing import Empty, Literal, StringEnd, Suppress, Word, ZeroOrMore, identbodychars, identchars
 
     separator = Literal(TAG_LIST_DELIMETER)
     principal_tag = (Word(identchars, identbodychars))('principal_tag')
@@ -41,19 +42,12 @@ def _normalize_principal(principal: str) -> list[str]:
     principal_module = principal_tag | empty_principal
 
     parser = ZeroOrMore(principal_module + Suppress(separator)) + principal_module + StringEnd()
+    parser.streamline()
+    return parser
 
-    try:
-        result = parser.parseString(principal)
-        return result.asList()
-    except ParseException:
-        raise TagthValidationError('Invalid principal format') from None
 
-
-def _normalize_resource(resource: str) -> list[tuple[str, str]]:
-    if not resource:
-        return []
-    if not isinstance(resource, str):
-        raise TagthValidationError('Bad resource: expected a string')
+def _build_resource_parser():
+    from pyparsing import Empty, Literal, StringEnd, Suppress, Word, ZeroOrMore, delimitedList, identbodychars, identchars
 
     separator = Literal(TAG_LIST_DELIMETER)
     resource_tag = (Word(identchars, identbodychars))('resource_tag')
@@ -75,74 +69,647 @@ def _normalize_resource(resource: str) -> list[tuple[str, str]]:
     resource_module = single_action_module | multiple_actions_module | empty_module
 
     parser = ZeroOrMore(resource_module + Suppress(separator)) + resource_module + StringEnd()
+    parser.streamline()
+    return parser
+
+
+# The reference grammars are only built (and pyparsing only imported) on first use. They are
+# streamlined eagerly under the lock, so concurrent parse calls only ever read the shared parsers.
+_reference_lock = threading.Lock()
+_reference_parsers = None
+
+
+def _get_reference_parsers():
+    global _reference_parsers
+
+    parsers = _reference_parsers
+
+    if parsers is None:
+        with _reference_lock:
+            if _reference_parsers is None:
+                _reference_parsers = (_build_principal_parser(), _build_resource_parser())
+            parsers = _reference_parsers
+
+    return parsers
+
+
+def _parse_principal_reference(principal: str) -> list[str]:
+    from pyparsing import ParseException
+
+    principal_parser, _ = _get_reference_parsers()
 
     try:
-        result = parser.parseString(resource)
+        result = principal_parser.parseString(principal)
+        return result.asList()
+    except ParseException:
+        raise TagthValidationError('Invalid principal format') from None
+
+
+def _parse_resource_reference(resource: str) -> list[tuple[str, str]]:
+    from pyparsing import ParseException
+
+    _, resource_parser = _get_reference_parsers()
+
+    try:
+        result = resource_parser.parseString(resource)
         return result.asList()
     except ParseException:
         raise TagthValidationError('Invalid resource format') from None
 
 
-def _resolve_internal(principal: list[str], resource: list[tuple[str, str]]) -> set[str]:
-    actions = set()
+# The scanner accepts exactly the language of the pyparsing grammars above: identifiers
+# are drawn from the same Latin-1 character sets as `identchars`/`identbodychars`, and
+# only pyparsing's default whitespace is skipped between tokens.
+_WHITESPACE = ' \t\n\r'
+_IDENT_START = ''.join(c for c in map(chr, range(256)) if c.isidentifier())
+_IDENT_BODY = ''.join(c for c in map(chr, range(256)) if ('_' + c).isidentifier())
+
+_SPACE_PATTERN = r'[ \t\n\r]*'
+_IDENT_PATTERN = '[{}][{}]*'.format(re.escape(_IDENT_START), re.escape(_IDENT_BODY))
+
+_PRINCIPAL_MODULE = re.compile(r'{s}({i})?{s}'.format(s=_SPACE_PATTERN, i=_IDENT_PATTERN))
+_RESOURCE_MODULE = re.compile(
+    r'{s}(?:({i}){s}:{s}(?:({i})|\{{{s}({i}(?:{s},{s}{i})*){s}\}}))?{s}'.format(s=_SPACE_PATTERN, i=_IDENT_PATTERN)
+)
+
+# The longest prefix of a resource module, for reporting where an invalid module goes wrong:
+# an unfinished module does not match `_RESOURCE_MODULE` at all.
+_RESOURCE_MODULE_PREFIX = re.compile(
+    r'{s}(?:{i}{s}(?::{s}(?:{i}|\{{{s}(?:{i}(?:{s},{s}{i})*{s}(?:,{s})?)?)?)?)?'.format(s=_SPACE_PATTERN, i=_IDENT_PATTERN)
+)
+
+_parse_engine = PARSE_ENGINE_SCANNER
+_parse_limits: Optional['ParseLimits'] = None
+_principal_cache: Optional[LRUCache] = None
+_resource_cache: Optional[LRUCache] = None
+
+
+def _scan_principal_into(principal: str, tags: list[str]) -> int:
+    # Appends the tags to `tags`; returns -1 on success or the offset at which scanning stopped.
+    position = 0
+    end = len(principal)
+
+    while True:
+        match = _PRINCIPAL_MODULE.match(principal, position)
+        tags.append(match.group(1) or VOID_PRINCIPAL)
+        position = match.end()
+
+        if position == end:
+            return -1
+
+        if principal[position] != TAG_LIST_DELIMETER:
+            return position
+
+        position += 1
+
+
+def _scan_principal(principal: str) -> list[str]:
+    tags = []
+
+    if _scan_principal_into(principal, tags) >= 0:
+        raise TagthValidationError('Invalid principal format')
+
+    return tags
+
+
+def _scan_resource_into(resource: str, pairs: list[tuple[str, str]]) -> int:
+    # Appends the pairs to `pairs`; returns -1 on success or the offset at which scanning stopped.
+    position = 0
+    end = len(resource)
+
+    while True:
+        match = _RESOURCE_MODULE.match(resource, position)
+        resource_tag, action, actions = match.groups()
+
+        if action is not None:
+            pairs.append((resource_tag, action))
+        elif actions is not None:
+            for act in actions.split(TAG_LIST_DELIMETER):
+                pairs.append((resource_tag, act.strip(_WHITESPACE)))
+        else:
+            pairs.append((EMPTY_RESOURCE_TAG, FULL_ACCESS_ACTION))
+
+        position = match.end()
+
+        if position == end:
+            return -1
+
+        if resource[position] != TAG_LIST_DELIMETER:
+            return max(position, _RESOURCE_MODULE_PREFIX.match(resource, match.start()).end())
+
+        position += 1
+
+
+def _scan_resource(resource: str) -> list[tuple[str, str]]:
+    pairs = []
+
+    if _scan_resource_into(resource, pairs) >= 0:
+        raise TagthValidationError('Invalid resource format')
+
+    return pairs
+
+
+def set_parse_engine(engine: str) -> None:
+    """Selects the parser used to normalize principal and resource strings.
+
+    Args:
+        engine (str): Either `PARSE_ENGINE_SCANNER` (the default) or `PARSE_ENGINE_PYPARSING`,
+            the reference implementation.
+    """
+    global _parse_engine
+
+    if engine not in (PARSE_ENGINE_SCANNER, PARSE_ENGINE_PYPARSING):
+        raise ValueError('Unknown parse engine')
 
-    for pr_tag in principal:
-        if pr_tag == ROOT_PRINCIPAL:
-            actions.add(FULL_ACCESS_ACTION)
+    _parse_engine = engine
 
+
+def get_parse_engine() -> str:
+    """Returns the name of the parser currently used to normalize tag strings."""
+    return _parse_engine
+
+
+class ParseLimits(NamedTuple):
+    """The size limits enforced before parsing; None means unlimited."""
+
+    max_length: Optional[int]
+    max_elements: Optional[int]
+
+
+def set_parse_limits(max_length: Optional[int] = None, max_elements: Optional[int] = None) -> None:
+    """Sets size limits that reject oversized principal and resource strings before parsing.
+
+    The scanner runs in time linear in the length of the input, so the limits bound the work
+    per string; they also bound the reference engine, which has no such guarantee. A string
+    over a limit fails with `TagthValidationError`. Calling this clears the normalization caches.
+
+    Args:
+        max_length (Optional[int]): The maximum length of a string in characters.
+        max_elements (Optional[int]): The maximum number of comma-separated elements, i.e. principal
+            tags or resource (tag, action) pairs.
+    """
+    global _parse_limits
+
+    if any(limit is not None and limit < 1 for limit in (max_length, max_elements)):
+        raise ValueError('Parse limits must be positive')
+
+    _parse_limits = None if max_length is None and max_elements is None else ParseLimits(max_length, max_elements)
+
+    for cache in (_principal_cache, _resource_cache):
+        if cache is not None:
+            cache.clear()
+
+
+def get_parse_limits() -> ParseLimits:
+    """Returns the size limits currently enforced before parsing."""
+    return _parse_limits or ParseLimits(None, None)
+
+
+def _exceeds(string: str, limits: ParseLimits) -> bool:
+    # Both checks run in C; the element count is bounded by the number of delimiters.
+    max_length, max_elements = limits
+    return (max_length is not None and len(string) > max_length) or (
+        max_elements is not None and string.count(TAG_LIST_DELIMETER) >= max_elements
+    )
+
+
+def _simple_principal(principal: str) -> Optional[list[str]]:
+    # The empty principal and a single ASCII identifier, `root` and `void` included, are most of
+    # the traffic. Any ASCII identifier is a valid tag, so they are normalized without a scan.
+    if not principal:
+        return [VOID_PRINCIPAL]
+
+    if principal.isascii() and principal.isidentifier():
+        return [principal]
+
+    return None
+
+
+def _simple_resource(resource: str) -> Optional[list[tuple[str, str]]]:
+    # Likewise a single `tag:action` pair of ASCII identifiers without whitespace. Lists are
+    # rejected with one substring search, the cheapest test on the slow path.
+    if TAG_LIST_DELIMETER not in resource and resource.isascii():
+        res_tag, delimiter, action = resource.partition(ACTION_DELIMETER)
+
+        if delimiter and res_tag.isidentifier() and action.isidentifier():
+            return [(res_tag, action)]
+
+    return None
+
+
+def _normalize_principal(principal: str) -> list[str]:
+    if not isinstance(principal, str):
+        raise TagthValidationError('Bad principal: expected a string')
+    if _parse_limits is not None and _exceeds(principal, _parse_limits):
+        raise TagthValidationError('Principal exceeds the parse limits')
+
+    if _parse_engine == PARSE_ENGINE_PYPARSING:
+        return _parse_principal_reference(principal)
+
+    return _simple_principal(principal) or _scan_principal(principal)
+
+
+def _normalize_resource(resource: str) -> list[tuple[str, str]]:
     if not resource:
-        return actions
+        return []
+    if not isinstance(resource, str):
+        raise TagthValidationError('Bad resource: expected a string')
+    if _parse_limits is not None and _exceeds(resource, _parse_limits):
+        raise TagthValidationError('Resource exceeds the parse limits')
 
-    for (res_tag, action) in resource:
-        if res_tag == ANYONE_PRINCIPAL:
-            actions.add(action)
+    if _parse_engine == PARSE_ENGINE_PYPARSING:
+        return _parse_resource_reference(resource)
 
-    for pr_tag in principal:
-        if pr_tag == VOID_PRINCIPAL:
-            continue
+    return _simple_resource(resource) or _scan_resource(resource)
 
-        for (res_tag, action) in resource:
-            if res_tag.startswith(pr_tag):
-                actions.add(action)
 
-    return actions
+# Below this many minimal supertags a single `str.startswith(tuple)` call beats bisection
+# (see benchmarks/bench_supertags.py for the crossover).
+_BISECT_MIN_SUPERTAGS = 32
 
 
-def _resolve(principal: str, resource: str) -> set[str]:
-    principal_list = _normalize_principal(principal)
-    resource_list = _normalize_resource(resource)
-    return _resolve_internal(principal_list, resource_list)
+def _minimal_supertags(tags: Iterable[str]) -> tuple[str, ...]:
+    # Sorted tags with every tag dropped that already has a supertag in the set. In such a
+    # prefix-free sorted list the only candidate supertag of a string is its predecessor,
+    # so a single bisection replaces the scan over all principal tags.
+    supertags = []
 
+    for tag in sorted(tags):
+        if not supertags or not tag.startswith(supertags[-1]):
+            supertags.append(tag)
 
-def allowed(principal: str, resource: str, action: str) -> bool:
-    """Checks if a given principal is allowed to perform an action on a resource.
+    return tuple(supertags)
+
+
+class _Principal:
+    # The evaluation state of a principal: the root flag and the minimal supertags. Principal
+    # strings passed to `allowed()` and the other query functions are evaluated through it, so
+    # their tags never reach the process-wide symbol table; only `compile_principal()` interns.
+
+    __slots__ = ('is_root', 'is_void', '_supertags')
+
+    def __init__(self, tags: Iterable[str]):
+        self._set_tags({tag for tag in tags if tag != VOID_PRINCIPAL})
+
+    def _set_tags(self, tags: Iterable[str]) -> None:
+        tags = tuple(tags)
+
+        object.__setattr__(self, 'is_root', ROOT_PRINCIPAL in tags)
+        object.__setattr__(self, 'is_void', not tags)
+        object.__setattr__(self, '_supertags', _minimal_supertags(tags))
+
+    def covers(self, resource_tag: str) -> bool:
+        """Checks if the principal possesses a resource tag, i.e. has the tag or its supertag.
+
+        Args:
+            resource_tag (str): The resource tag to match.
+
+        Returns:
+            bool: True if one of the principal tags is a prefix of the resource tag.
+        """
+        supertags = self._supertags
+
+        if len(supertags) < _BISECT_MIN_SUPERTAGS:
+            return resource_tag.startswith(supertags)
+
+        index = bisect_right(supertags, resource_tag)
+        return index > 0 and resource_tag.startswith(supertags[index - 1])
+
+
+class CompiledPrincipal(_Principal):
+    """A normalized principal that can be reused across many checks.
+
+    Instances are immutable and hashable; two principals with the same set of effective tags
+    compare equal. `void` modules are dropped from `tags`, and a principal without any other
+    tag is void. Tags are interned in the process-wide symbol table and stored as an integer array.
+    """
+
+    __slots__ = ('_tag_ids', '_hash')
+
+    def __init__(self, tags: Iterable[str]):
+        self._build({SYMBOLS.intern(tag) for tag in tags if tag != VOID_PRINCIPAL})
+
+    @classmethod
+    def _from_ids(cls, tag_ids: Iterable[int]) -> 'CompiledPrincipal':
+        # Builds a principal from interned tag IDs, none of which is `void`.
+        principal = object.__new__(cls)
+        principal._build(set(tag_ids))
+        return principal
+
+    def _build(self, tag_ids: set[int]) -> None:
+        tag_ids = sorted(tag_ids)
+        strings = SYMBOLS.strings
+
+        # The supertags are the interned string objects, shared with every other compiled form.
+        self._set_tags(strings[tag_id] for tag_id in tag_ids)
+        object.__setattr__(self, '_tag_ids', array('I', tag_ids))
+        object.__setattr__(self, '_hash', hash(tuple(tag_ids)))
+
+    @property
+    def tags(self) -> frozenset[str]:
+        """The effective tags of the principal."""
+        strings = SYMBOLS.strings
+        return frozenset(strings[tag_id] for tag_id in self._tag_ids)
+
+    def __reduce__(self):
+        # Symbol IDs are process-local, so copies and pickles are rebuilt from the tag strings.
+        return (CompiledPrincipal, (sorted(self.tags),))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CompiledPrincipal is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('CompiledPrincipal is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledPrincipal):
+            return NotImplemented
+        return self._tag_ids == other._tag_ids
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return 'CompiledPrincipal({!r})'.format(', '.join(sorted(self.tags)) or VOID_PRINCIPAL)
+
+
+def compile_principal(principal: Union[str, CompiledPrincipal]) -> CompiledPrincipal:
+    """Parses a principal string once for reuse across many checks.
+
+    The tags are interned in the process-wide symbol table, which never shrinks, so compile the
+    principals you keep rather than every string you are asked to check.
 
     Args:
         principal (str): A string representing the principal tags.
+
+    Returns:
+        CompiledPrincipal: The immutable, hashable compiled principal.
+    """
+    if isinstance(principal, CompiledPrincipal):
+        return principal
+
+    return CompiledPrincipal(_load_principal(principal))
+
+
+def _query_principal(principal: Union[str, CompiledPrincipal]) -> _Principal:
+    # Principal strings are evaluated without interning their tags; see `_Principal`.
+    if isinstance(principal, _Principal):
+        return principal
+
+    return _Principal(_load_principal(principal))
+
+
+_NO_ACTIONS = frozenset()
+
+
+class CompiledResource:
+    """A normalized resource ACL that is safe to cache next to the raw string.
+
+    Instances are immutable and hashable; two ACLs with the same set of (tag, action) pairs
+    compare equal. `tag_actions` maps every resource tag to the actions it grants,
+    `anyone_actions` holds the actions granted to any principal, `is_void` is set for the
+    void resource and `is_empty` for any ACL that grants nothing to non-root principals.
+
+    Tags and actions are interned in the process-wide symbol table. The ACL itself is kept as a
+    table of every tag with its actions, ordered by symbol ID and holding the interned string
+    objects, so checks compare strings without decoding IDs, equal ACLs have equal tables and
+    the strings themselves are shared by all compiled ACLs.
+    """
+
+    __slots__ = ('is_void', 'is_empty', '_table', '_tag_actions', '_hash')
+
+    def __init__(self, pairs: Iterable[tuple[str, str]]):
+        intern = SYMBOLS.intern
+        grouped = {}
+
+        for (res_tag, action) in pairs:
+            grouped.setdefault(intern(res_tag), set()).add(intern(action))
+
+        self._build(grouped)
+
+    @classmethod
+    def _from_ids(cls, grouped: dict[int, set[int]]) -> 'CompiledResource':
+        # Builds a resource from interned tag IDs mapped to sets of interned action IDs.
+        resource = object.__new__(cls)
+        resource._build(grouped)
+        return resource
+
+    def _build(self, grouped: dict[int, set[int]]) -> None:
+        strings = SYMBOLS.strings
+        table = tuple(
+            (strings[tag_id], tuple(strings[action_id] for action_id in sorted(grouped[tag_id])))
+            for tag_id in sorted(grouped)
+        )
+
+        object.__setattr__(self, 'is_void', not table)
+        object.__setattr__(self, 'is_empty', set(grouped) <= {SYMBOLS.get(EMPTY_RESOURCE_TAG)})
+        object.__setattr__(self, '_table', table)
+        object.__setattr__(self, '_tag_actions', None)
+        object.__setattr__(self, '_hash', hash(table))
+
+    def _items(self) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        return self._table
+
+    @property
+    def pairs(self) -> frozenset[tuple[str, str]]:
+        """The distinct (tag, action) pairs of the ACL."""
+        return frozenset((res_tag, action) for (res_tag, actions) in self._table for action in actions)
+
+    @property
+    def tag_actions(self) -> MappingProxyType:
+        """A read-only map of every resource tag to the actions it grants."""
+        # Built on first access and kept: evaluation reads the table, and most cached ACLs are
+        # never asked for the map.
+        tag_actions = self._tag_actions
+
+        if tag_actions is None:
+            tag_actions = MappingProxyType({res_tag: frozenset(actions) for (res_tag, actions) in self._table})
+            object.__setattr__(self, '_tag_actions', tag_actions)
+
+        return tag_actions
+
+    @property
+    def anyone_actions(self) -> frozenset[str]:
+        """The actions granted to any principal."""
+        return self.tag_actions.get(ANYONE_PRINCIPAL, _NO_ACTIONS)
+
+    def __reduce__(self):
+        # Likewise rebuilt from the (tag, action) pairs rather than the process-local symbol IDs.
+        return (CompiledResource, (sorted(self.pairs),))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CompiledResource is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('CompiledResource is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledResource):
+            return NotImplemented
+        return self._table == other._table
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return 'CompiledResource({!r})'.format(', '.join('{}:{}'.format(*pair) for pair in sorted(self.pairs)))
+
+
+def compile_resource(resource: Union[str, CompiledResource]) -> CompiledResource:
+    """Parses a resource string once for reuse across many checks.
+
+    Args:
         resource (str): A string representing the pairs of tags and actions.
-        action (str): The action to check for permission.
 
     Returns:
-        bool: True if the action is allowed, False otherwise.
+        CompiledResource: The immutable, hashable compiled resource.
     """
-    if not isinstance(action, str):
-        raise TagthValidationError('Bad action: expected a string')
+    if isinstance(resource, CompiledResource):
+        return resource
+
+    return CompiledResource(_load_resource(resource))
+
+
+def _resolve_internal(
+    principal: Union[list[str], _Principal],
+    resource: Union[list[tuple[str, str]], CompiledResource],
+) -> set[str]:
+    if not isinstance(principal, _Principal):
+        principal = _Principal(principal)
+
+    actions = set()
+
+    if principal.is_root:
+        actions.add(FULL_ACCESS_ACTION)
+
+    items = resource._table if isinstance(resource, CompiledResource) else ((res_tag, (action,)) for (res_tag, action) in resource)
 
-    actions = _resolve(principal, resource)
+    for (res_tag, tag_actions) in items:
+        if res_tag == ANYONE_PRINCIPAL or principal.covers(res_tag):
+            actions.update(tag_actions)
+
+    return actions
 
-    if FULL_ACCESS_ACTION in actions:
+
+def _grants(granted: str, action: str) -> bool:
+    # The `all` action grants everything but is never granted through a prefix of it.
+    return granted == FULL_ACCESS_ACTION or (action != FULL_ACCESS_ACTION and action.startswith(granted))
+
+
+def _allowed_internal(
+    principal: _Principal,
+    resource: Union[list[tuple[str, str]], CompiledResource],
+    action: str,
+) -> bool:
+    # Same decision as resolving the full action set with `_resolve_internal()` and then
+    # matching the action against it, but returns on the first granting pair.
+    if principal.is_root:
         return True
 
-    if action == FULL_ACCESS_ACTION:
+    if isinstance(resource, CompiledResource):
+        for (res_tag, tag_actions) in resource._table:
+            if res_tag == ANYONE_PRINCIPAL or principal.covers(res_tag):
+                if FULL_ACCESS_ACTION in tag_actions or action in tag_actions:
+                    return True
+                for granted in tag_actions:
+                    if _grants(granted, action):
+                        return True
+
         return False
 
-    for allowed_action in actions:
-        if action.startswith(allowed_action):
+    for (res_tag, granted) in resource:
+        if _grants(granted, action) and (res_tag == ANYONE_PRINCIPAL or principal.covers(res_tag)):
             return True
 
     return False
 
 
+def enable_cache(max_entries: int = 4096, max_bytes: Optional[int] = None) -> None:
+    """Enables bounded LRU caches of normalized principal and resource strings.
+
+    Invalid strings are cached too, so repeated garbage input is rejected without re-parsing.
+    Calling this again replaces the caches and resets their statistics.
+
+    Args:
+        max_entries (int): The maximum number of strings kept in each cache.
+        max_bytes (Optional[int]): An approximate memory budget for each cache, in bytes.
+    """
+    global _principal_cache, _resource_cache
+
+    _principal_cache = LRUCache(_normalize_principal, TagthValidationError, max_entries, max_bytes)
+    _resource_cache = LRUCache(_normalize_resource, TagthValidationError, max_entries, max_bytes)
+
+
+def disable_cache() -> None:
+    """Disables and drops the normalization caches."""
+    global _principal_cache, _resource_cache
+
+    _principal_cache = None
+    _resource_cache = None
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Returns hit, miss and eviction counters of the normalization caches.
+
+    Returns:
+        dict[str, CacheStats]: Statistics keyed by `principal` and `resource`, empty if caching is disabled.
+    """
+    principal_cache, resource_cache = _principal_cache, _resource_cache
+
+    if principal_cache is None or resource_cache is None:
+        return {}
+
+    return {'principal': principal_cache.stats(), 'resource': resource_cache.stats()}
+
+
+def _load_principal(principal: str) -> list[str]:
+    cache = _principal_cache
+
+    if cache is None or not isinstance(principal, str):
+        return _normalize_principal(principal)
+
+    return cache.get(principal)
+
+
+def _load_resource(resource: Union[str, CompiledResource]) -> Union[list[tuple[str, str]], CompiledResource]:
+    if isinstance(resource, CompiledResource):
+        return resource
+
+    cache = _resource_cache
+
+    if cache is None or not isinstance(resource, str):
+        return _normalize_resource(resource)
+
+    return cache.get(resource)
+
+
+def _resolve(principal: Union[str, CompiledPrincipal], resource: Union[str, CompiledResource]) -> set[str]:
+    principal_list = principal if isinstance(principal, _Principal) else _load_principal(principal)
+    resource_list = _load_resource(resource)
+    return _resolve_internal(principal_list, resource_list)
+
+
+def allowed(principal: Union[str, CompiledPrincipal], resource: Union[str, CompiledResource], action: str) -> bool:
+    """Checks if a given principal is allowed to perform an action on a resource.
+
+    Args:
+        principal (str | CompiledPrincipal): A string representing the principal tags, or a principal
+            compiled with `compile_principal()`.
+        resource (str | CompiledResource): A string representing the pairs of tags and actions, or a
+            resource compiled with `compile_resource()`.
+        action (str): The action to check for permission.
+
+    Returns:
+        bool: True if the action is allowed, False otherwise.
+    """
+    if not isinstance(action, str):
+        raise TagthValidationError('Bad action: expected a string')
+
+    principal = _query_principal(principal)
+    resource_list = _load_resource(resource)
+    return _allowed_internal(principal, resource_list, action)
+
+
 def validate_principal(principal: str) -> bool:
     """Validates the principal string.
 
@@ -153,7 +720,7 @@ def validate_principal(principal: str) -> bool:
         bool: True if the principal is valid, False otherwise.
     """
     try:
-        _normalize_principal(principal)
+        _load_principal(principal)
     except TagthValidationError:
         return False
 
@@ -170,8 +737,78 @@ def validate_resource(resource: str) -> bool:
         bool: True if the resource is valid, False otherwise.
     """
     try:
-        _normalize_resource(resource)
+        _load_resource(resource)
     except TagthValidationError:
         return False
 
     return True
+
+
+class ValidationIssue(NamedTuple):
+    """An invalid item reported by `validate_principals()` or `validate_resources()`.
+
+    `category` is `VALIDATION_BAD_TYPE`, `VALIDATION_TOO_LARGE` or `VALIDATION_BAD_FORMAT`.
+    `offset` is the character offset of the first character that does not fit the grammar, or
+    the length of the string if it ends too early; None if the item was rejected before parsing. It is meant for internal logs only and is never part of an exception message.
+    """
+
+    index: int
+    category: str
+    offset: Optional[int]
+
+
+def validate_principals(principals: Iterable[str]) -> Iterator[ValidationIssue]:
+    """Validates many principal strings without raising for invalid ones.
+
+    Strings are checked with the single-pass scanner, which accepts exactly the same language as
+    the reference grammar, and bypass the normalization cache.
+
+    Args:
+        principals (Iterable[str]): The principal strings to validate.
+
+    Returns:
+        Iterator[ValidationIssue]: The invalid items, lazily and in input order.
+    """
+    for index, principal in enumerate(principals):
+        if not isinstance(principal, str):
+            yield ValidationIssue(index, VALIDATION_BAD_TYPE, None)
+            continue
+
+        if _parse_limits is not None and _exceeds(principal, _parse_limits):
+            yield ValidationIssue(index, VALIDATION_TOO_LARGE, None)
+            continue
+
+        offset = _scan_principal_into(principal, [])
+
+        if offset >= 0:
+            yield ValidationIssue(index, VALIDATION_BAD_FORMAT, offset)
+
+
+def validate_resources(resources: Iterable[str]) -> Iterator[ValidationIssue]:
+    """Validates many resource strings without raising for invalid ones.
+
+    Strings are checked with the single-pass scanner, which accepts exactly the same language as
+    the reference grammar, and bypass the normalization cache.
+
+    Args:
+        resources (Iterable[str]): The resource strings to validate.
+
+    Returns:
+        Iterator[ValidationIssue]: The invalid items, lazily and in input order.
+    """
+    for index, resource in enumerate(resources):
+        if not resource:
+            continue
+
+        if not isinstance(resource, str):
+            yield ValidationIssue(index, VALIDATION_BAD_TYPE, None)
+            continue
+
+        if _parse_limits is not None and _exceeds(resource, _parse_limits):
+            yield ValidationIssue(index, VALIDATION_TOO_LARGE, None)
+            continue
+
+        offset = _scan_resource_into(resource, [])
+
+        if offset >= 0:
+            yield ValidationIssue(index, VALIDATION_BAD_FORMAT, offset)
@@ -0,0 +1,266 @@
+import sys
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import Iterable, Optional, Sequence, Union
+
+from .tagth import (
+    ANYONE_PRINCIPAL,
+    EMPTY_RESOURCE_TAG,
+    FULL_ACCESS_ACTION,
+    CompiledPrincipal,
+    CompiledResource,
+    TagthValidationError,
+    _allowed_internal,
+    _load_resource,
+    _Principal,
+    _query_principal,
+    compile_principal,
+    compile_resource,
+)
+
+
+def _prefix_range(tags: Sequence[str], prefix: str) -> tuple[int, int]:
+    # In a sorted sequence the strings starting with `prefix` form one contiguous run, between
+    # the prefix itself and the prefix with its last character incremented.
+    low = bisect_left(tags, prefix)
+    last = ord(prefix[-1])
+
+    if last < sys.maxunicode:
+        return low, bisect_left(tags, prefix[:-1] + chr(last + 1), low)
+
+    high = low
+    while high < len(tags) and tags[high].startswith(prefix):
+        high += 1
+
+    return low, high
+
+
+class UniversePrincipal:
+    """A principal compiled against a `TagUniverse`: the bitmask of universe tags it covers.
+
+    Instances are immutable and hashable, so they can be cached like `CompiledPrincipal`. The
+    mask is only meaningful to the universe that compiled it.
+    """
+
+    __slots__ = ('principal', 'mask', 'is_root')
+
+    def __init__(self, principal: CompiledPrincipal, mask: int):
+        object.__setattr__(self, 'principal', principal)
+        object.__setattr__(self, 'mask', mask)
+        object.__setattr__(self, 'is_root', principal.is_root)
+
+    def __reduce__(self):
+        return (UniversePrincipal, (self.principal, self.mask))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('UniversePrincipal is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('UniversePrincipal is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, UniversePrincipal):
+            return NotImplemented
+        return self.mask == other.mask and self.principal == other.principal
+
+    def __hash__(self):
+        return hash((self.principal, self.mask))
+
+
+class UniverseResource:
+    """A resource compiled against a `TagUniverse`: a tag bitmask per granted action.
+
+    `grants` is a read-only map of action IDs to tag bitmasks, or None if the resource uses tags
+    or actions outside of the universe; such resources are evaluated on the string path.
+    Instances are immutable and hashable, so they can be cached like `CompiledResource`.
+    """
+
+    __slots__ = ('resource', 'grants')
+
+    def __init__(self, resource: CompiledResource, grants: Optional[dict[int, int]]):
+        object.__setattr__(self, 'resource', resource)
+        object.__setattr__(self, 'grants', None if grants is None else MappingProxyType(dict(grants)))
+
+    def __reduce__(self):
+        return (UniverseResource, (self.resource, None if self.grants is None else dict(self.grants)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('UniverseResource is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('UniverseResource is immutable')
+
+    def __eq__(self, other):
+        if not isinstance(other, UniverseResource):
+            return NotImplemented
+        return self.grants == other.grants and self.resource == other.resource
+
+    def __hash__(self):
+        return hash(self.resource)
+
+
+class TagUniverse:
+    """A bitset evaluation engine over a fixed vocabulary of resource tags and actions.
+
+    Universe tags are numbered in sorted order, so all tags sharing a prefix occupy a contiguous
+    run of bits, and the tags a principal possesses are a union of such runs. A principal becomes
+    the bitmask of universe tags it covers and a resource becomes a tag bitmask per granted
+    action, so `allowed()` reduces to a bitwise AND. Decisions match `allowed()` exactly;
+    resources with tags or actions outside the universe fall back to the string path.
+
+    Args:
+        tags (Iterable[str]): The resource tags of the universe.
+        actions (Iterable[str]): The actions of the universe.
+    """
+
+    def __init__(self, tags: Iterable[str], actions: Iterable[str]):
+        self._tags = sorted(set(tags) | {ANYONE_PRINCIPAL, EMPTY_RESOURCE_TAG})
+        self._tag_bits = {tag: index for index, tag in enumerate(self._tags)}
+        self._anyone_mask = 1 << self._tag_bits[ANYONE_PRINCIPAL]
+
+        self._actions = sorted(set(actions) | {FULL_ACCESS_ACTION})
+        self._action_ids = {action: index for index, action in enumerate(self._actions)}
+        self._full_access_id = self._action_ids[FULL_ACCESS_ACTION]
+
+        # The prefix-closure table: every universe tag mapped to the bits of the tags it covers.
+        self._cover = {tag: self._prefix_mask(tag) for tag in self._tags}
+        # Every universe action mapped to the universe actions granting it.
+        self._granting = {action: self._granting_ids(action) for action in self._actions}
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        return tuple(self._tags)
+
+    @property
+    def actions(self) -> tuple[str, ...]:
+        return tuple(self._actions)
+
+    def _prefix_mask(self, prefix: str) -> int:
+        low, high = _prefix_range(self._tags, prefix)
+        return ((1 << (high - low)) - 1) << low
+
+    def _granting_ids(self, action: str) -> tuple[int, ...]:
+        # `all` grants everything, and is itself only granted by `all`.
+        if action == FULL_ACCESS_ACTION:
+            return (self._full_access_id,)
+
+        action_ids = self._action_ids
+        granting = {self._full_access_id}
+
+        for length in range(1, len(action) + 1):
+            action_id = action_ids.get(action[:length])
+            if action_id is not None:
+                granting.add(action_id)
+
+        return tuple(granting)
+
+    def _mask(self, principal: _Principal) -> int:
+        # The bits of the universe tags covered by the principal; its minimal supertags cover
+        # the same tags as all of its tags.
+        mask = self._anyone_mask
+        cover = self._cover
+
+        for tag in principal._supertags:
+            tag_mask = cover.get(tag)
+            mask |= self._prefix_mask(tag) if tag_mask is None else tag_mask
+
+        return mask
+
+    def _grants(self, pairs: Iterable[tuple[str, str]]) -> Optional[dict[int, int]]:
+        # The tag bitmask per granted action, or None if a pair is outside the universe.
+        tag_bits, action_ids = self._tag_bits, self._action_ids
+        grants = {}
+
+        for (res_tag, action) in pairs:
+            bit, action_id = tag_bits.get(res_tag), action_ids.get(action)
+
+            if bit is None or action_id is None:
+                return None
+
+            grants[action_id] = grants.get(action_id, 0) | (1 << bit)
+
+        return grants
+
+    def compile_principal(self, principal: Union[str, CompiledPrincipal, UniversePrincipal]) -> UniversePrincipal:
+        """Compiles a principal into the bitmask of universe tags it covers.
+
+        Like `tagth.compile_principal()`, this interns the tags of a principal string; `allowed()`
+        evaluates strings without interning them.
+
+        Args:
+            principal (str | CompiledPrincipal | UniversePrincipal): The principal to compile.
+
+        Returns:
+            UniversePrincipal: The compiled principal.
+        """
+        if isinstance(principal, UniversePrincipal):
+            return principal
+
+        principal = compile_principal(principal)
+        return UniversePrincipal(principal, self._mask(principal))
+
+    def compile_resource(self, resource: Union[str, CompiledResource, UniverseResource]) -> UniverseResource:
+        """Compiles a resource into a tag bitmask per granted action.
+
+        Like `tagth.compile_resource()`, this interns the tags and actions of a resource string;
+        `allowed()` evaluates strings without interning them.
+
+        Args:
+            resource (str | CompiledResource | UniverseResource): The resource to compile.
+
+        Returns:
+            UniverseResource: The compiled resource.
+        """
+        if isinstance(resource, UniverseResource):
+            return resource
+
+        resource = compile_resource(resource)
+        return UniverseResource(resource, self._grants(resource.pairs))
+
+    def allowed(
+        self,
+        principal: Union[str, CompiledPrincipal, UniversePrincipal],
+        resource: Union[str, CompiledResource, UniverseResource],
+        action: str,
+    ) -> bool:
+        """Checks if a given principal is allowed to perform an action on a resource.
+
+        Args:
+            principal (str | CompiledPrincipal | UniversePrincipal): The principal tags.
+            resource (str | CompiledResource | UniverseResource): The resource tags and actions.
+            action (str): The action to check for permission.
+
+        Returns:
+            bool: True if the action is allowed, False otherwise.
+        """
+        if not isinstance(action, str):
+            raise TagthValidationError('Bad action: expected a string')
+
+        # Strings are evaluated without interning, like `tagth.allowed()`.
+        if isinstance(principal, UniversePrincipal):
+            principal, principal_mask = principal.principal, principal.mask
+        else:
+            principal = _query_principal(principal)
+            principal_mask = self._mask(principal)
+
+        if isinstance(resource, UniverseResource):
+            resource, grants = resource.resource, resource.grants
+        else:
+            resource = _load_resource(resource)
+            grants = self._grants(resource.pairs if isinstance(resource, CompiledResource) else resource)
+
+        if principal.is_root:
+            return True
+
+        if grants is None:
+            return _allowed_internal(principal, resource, action)
+
+        granting = self._granting.get(action)
+        if granting is None:
+            granting = self._granting_ids(action)
+
+        mask = 0
+        for action_id in granting:
+            mask |= grants.get(action_id, 0)
+
+        return mask & principal_mask != 0
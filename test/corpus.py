@@ -0,0 +1,32 @@
+import random
+
+TAGS = ['a', 'ab', 'abc', 'admin', 'admin_user', 'user', 'root', 'void', 'v', 'anyone', 'any', 'me', 'meme']
+ACTIONS = ['a', 'al', 'all', 'read', 'read_all', 'write', 'r', 'delete']
+
+
+def random_principal(rng: random.Random) -> str:
+    modules = [rng.choice(TAGS + ['', ' ']) for _ in range(rng.randint(1, 4))]
+    return ', '.join(modules)
+
+
+def random_resource(rng: random.Random) -> str:
+    modules = []
+
+    for _ in range(rng.randint(0, 4)):
+        choice = rng.random()
+        tag = rng.choice(TAGS)
+
+        if choice < 0.1:
+            modules.append(' ')
+        elif choice < 0.6:
+            modules.append(f'{tag}:{rng.choice(ACTIONS)}')
+        else:
+            actions = ', '.join(rng.choice(ACTIONS) for _ in range(rng.randint(1, 3)))
+            modules.append(f'{tag}:{{{actions}}}')
+
+    return ', '.join(modules)
+
+
+def random_triples(seed: int, count: int) -> list[tuple[str, str, str]]:
+    rng = random.Random(seed)
+    return [(random_principal(rng), random_resource(rng), rng.choice(ACTIONS + ['read_x', 'alla'])) for _ in range(count)]
@@ -0,0 +1,28 @@
+import pytest
+
+from corpus import random_triples
+from tagth.tagth import FULL_ACCESS_ACTION, TagthValidationError, _resolve, allowed, compile_principal, compile_resource
+
+
+def _allowed_by_resolve(p, r, action):
+    actions = _resolve(p, r)
+
+    if FULL_ACCESS_ACTION in actions:
+        return True
+
+    if action == FULL_ACCESS_ACTION:
+        return False
+
+    return any(action.startswith(allowed_action) for allowed_action in actions)
+
+
+def test_matches_resolved_action_set():
+    for p, r, action in random_triples(7, 3000):
+        expected = _allowed_by_resolve(p, r, action)
+        assert allowed(p, r, action) == expected, (p, r, action)
+        assert allowed(compile_principal(p), compile_resource(r), action) == expected, (p, r, action)
+
+
+def test_root_still_validates_resource():
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        allowed('root', 'a:{}', 'read')
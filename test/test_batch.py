@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from corpus import random_triples
+from tagth import afilter_allowed, allowed_many, filter_allowed
+from tagth.tagth import TagthValidationError, allowed, compile_principal, compile_resource
+
+
+def test_allowed_many():
+    resources = ['content:read', 'metadata:write', '', 'anyone:read', 'content:read', None]
+    assert allowed_many('content', resources, 'read') == [True, False, False, True, True, False]
+    assert allowed_many('root', resources, 'read') == [True] * 6
+
+
+def test_matches_allowed():
+    triples = random_triples(8, 500)
+    resources = [r for (_, r, _) in triples]
+
+    for p, _, action in triples[:50]:
+        expected = [allowed(p, r, action) for r in resources]
+        assert allowed_many(p, resources, action) == expected
+        assert allowed_many(compile_principal(p), [compile_resource(r) for r in resources], action) == expected
+
+
+def test_bitmap():
+    resources = ['a:read', 'b:read'] * 5
+    bits = allowed_many('a', resources, 'read', bitmap=True)
+    assert bits == bytearray([0b01010101, 0b01])
+    assert allowed_many('a', [], 'read', bitmap=True) == bytearray()
+
+
+def test_accepts_iterators_and_unhashable_resources():
+    assert allowed_many('a', iter(['a:read', 'b:read']), 'read') == [True, False]
+    assert allowed_many('a', [[], 'a:read'], 'read') == [False, True]
+
+
+def test_invalid_input():
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        allowed_many('a', ['a:read'], None)
+
+    with pytest.raises(TagthValidationError, match='Invalid principal format'):
+        allowed_many('a b', ['a:read'], 'read')
+
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        allowed_many('root', ['a:read', 'a:{}'], 'read')
+
+
+ROWS = [
+    {'id': 1, 'acl': 'content:read'},
+    {'id': 2, 'acl': 'metadata:write'},
+    {'id': 3, 'acl': 'anyone:read'},
+    {'id': 4, 'acl': ''},
+    {'id': 5, 'acl': 'content:{read, write}'},
+    {'id': 6, 'acl': 'content:read'},
+]
+
+
+def test_filter_allowed():
+    permitted = filter_allowed('content', iter(ROWS), 'read', key=lambda row: row['acl'])
+    assert [row['id'] for row in permitted] == [1, 3, 5, 6]
+
+    assert list(filter_allowed('content', ['content:read', 'x:read'], 'read')) == ['content:read']
+
+
+def test_filter_allowed_is_lazy():
+    def rows():
+        yield 'content:read'
+        raise AssertionError('consumed too far')
+
+    assert next(filter_allowed('content', rows(), 'read')) == 'content:read'
+
+
+def test_filter_allowed_with_small_cache():
+    triples = random_triples(9, 300)
+    resources = [r for (_, r, _) in triples]
+    p, _, action = triples[0]
+
+    expected = [r for r in resources if allowed(p, r, action)]
+    assert list(filter_allowed(p, resources, action, cache_size=3)) == expected
+
+
+def test_filter_allowed_validates_eagerly():
+    with pytest.raises(TagthValidationError, match='Invalid principal format'):
+        filter_allowed('a b', [], 'read')
+
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        afilter_allowed('a', [], 1)
+
+    with pytest.raises(ValueError):
+        filter_allowed('a', [], 'read', cache_size=0)
+
+
+def test_afilter_allowed():
+    async def rows():
+        for row in ROWS:
+            await asyncio.sleep(0)
+            yield row
+
+    async def collect():
+        return [row['id'] async for row in afilter_allowed('content', rows(), 'write', key=lambda row: row['acl'])]
+
+    assert asyncio.run(collect()) == [5]
@@ -0,0 +1,87 @@
+import pytest
+
+from corpus import random_triples
+from tagth import bulk
+from tagth.bulk import bulk_allowed
+from tagth.symbols import SYMBOLS
+from tagth.tagth import TagthValidationError, allowed
+
+
+def test_matches_allowed():
+    triples = random_triples(18, 2000)
+    expected = [allowed(p, r, a) for (p, r, a) in triples]
+    assert list(bulk_allowed(triples, max_workers=2, chunk_size=128)) == expected
+
+
+def test_streams_in_order():
+    triples = [('a', 'a:read', 'read'), ('b', 'a:read', 'read')] * 50
+    decisions = bulk_allowed(iter(triples), max_workers=2, chunk_size=3)
+    assert next(decisions) is True
+    assert next(decisions) is False
+    assert list(decisions) == [True, False] * 49
+
+
+def test_empty_input():
+    assert list(bulk_allowed([], max_workers=1)) == []
+
+
+def test_invalid_input():
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        list(bulk_allowed([('a', 'a:read', None)], max_workers=1))
+
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        list(bulk_allowed([('a', 'a:{}', 'read')], max_workers=1))
+
+    with pytest.raises(ValueError):
+        bulk_allowed([], chunk_size=0)
+
+
+def test_reads_input_lazily():
+    consumed = []
+
+    def triples():
+        for index in range(1000):
+            consumed.append(index)
+            yield ('a', 'a:read', 'read')
+
+    decisions = bulk_allowed(triples(), max_workers=1, chunk_size=10)
+    assert consumed == []
+    assert next(decisions) is True
+    assert len(consumed) <= 30
+    assert list(decisions) == [True] * 999
+
+
+def test_yields_decisions_before_input_error():
+    def triples():
+        yield ('a', 'a:read', 'read')
+        yield ('b', 'a:read', 'read')
+        yield ('a', 'a:read', 'read')
+        raise RuntimeError('source failed')
+
+    decisions = bulk_allowed(triples(), max_workers=1, chunk_size=2)
+    assert next(decisions) is True
+    assert next(decisions) is False
+    assert next(decisions) is True
+
+    with pytest.raises(RuntimeError, match='source failed'):
+        next(decisions)
+
+
+def test_worker_caches_are_bounded(monkeypatch):
+    # Runs the worker function in this process to inspect its caches.
+    monkeypatch.setattr(bulk, '_CACHE_ENTRIES', 50)
+    monkeypatch.setattr(bulk, '_principals', bulk.OrderedDict())
+    monkeypatch.setattr(bulk, '_resources', bulk.OrderedDict())
+    before = len(SYMBOLS)
+
+    for offset in range(0, 1000, 100):
+        triples = [(f'bulk_user_{i}', f'bulk_user_{i}:read', 'read') for i in range(offset, offset + 100)]
+        (task, _) = bulk._read_window(iter(triples), 100)
+        assert bulk._evaluate(task) == b'\x01' * 100
+
+    assert len(bulk._principals) == len(bulk._resources) == 50
+    assert len(SYMBOLS) == before
+
+    (task, _) = bulk._read_window(iter([('bulk_user_999', 'bulk_user_999:read', 'read')]), 1)
+    assert bulk._evaluate(task) == b'\x01'
+    assert isinstance(bulk._resources['bulk_user_999:read'], bulk.CompiledResource)
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from corpus import random_principal, random_resource
+from tagth import (
+    VALIDATION_BAD_FORMAT,
+    VALIDATION_BAD_TYPE,
+    TagthValidationError,
+    ValidationIssue,
+    set_parse_engine,
+    validate_principal,
+    validate_principals,
+    validate_resource,
+    validate_resources,
+)
+from tagth.tagth import PARSE_ENGINE_PYPARSING, PARSE_ENGINE_SCANNER, compile_principal, compile_resource
+
+
+def _mutate(rng, string):
+    position = rng.randrange(len(string) + 1)
+    return string[:position] + rng.choice(':{},@ \t-') + string[position:]
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(28)
+    principals = [random_principal(rng) for _ in range(500)]
+    resources = [random_resource(rng) for _ in range(500)]
+    return [_mutate(rng, p) for p in principals] + principals, [_mutate(rng, r) for r in resources] + resources
+
+
+@pytest.mark.parametrize('engine', [PARSE_ENGINE_SCANNER, PARSE_ENGINE_PYPARSING])
+def test_matches_single_validation(corpus, engine):
+    principals, resources = corpus
+    set_parse_engine(engine)
+
+    try:
+        invalid_principals = [index for index, p in enumerate(principals) if not validate_principal(p)]
+        invalid_resources = [index for index, r in enumerate(resources) if not validate_resource(r)]
+    finally:
+        set_parse_engine(PARSE_ENGINE_SCANNER)
+
+    assert invalid_principals
+    assert [issue.index for issue in validate_principals(principals)] == invalid_principals
+    assert [issue.index for issue in validate_resources(resources)] == invalid_resources
+
+
+def test_issues():
+    principals = ['user', 'user:read', None, '', 'a,, b', 'a b', 42]
+    assert list(validate_principals(principals)) == [
+        ValidationIssue(1, VALIDATION_BAD_FORMAT, 4),
+        ValidationIssue(2, VALIDATION_BAD_TYPE, None),
+        ValidationIssue(5, VALIDATION_BAD_FORMAT, 2),
+        ValidationIssue(6, VALIDATION_BAD_TYPE, None),
+    ]
+
+    resources = ['a:read', 'a:read, b', '', None, 'a:{read, }', ['a:read'], 'a:{read write}']
+    assert list(validate_resources(resources)) == [
+        ValidationIssue(1, VALIDATION_BAD_FORMAT, 9),
+        ValidationIssue(4, VALIDATION_BAD_FORMAT, 9),
+        ValidationIssue(5, VALIDATION_BAD_TYPE, None),
+        ValidationIssue(6, VALIDATION_BAD_FORMAT, 8),
+    ]
+
+
+def test_offsets_point_at_the_error():
+    resources = {
+        'content:{read write}': 14,
+        'a:read, b:read, c:{x y}': 21,
+        'a:{read,,x}': 8,
+        'a:{read} x': 9,
+        'a:read:x': 6,
+        'a b:read': 2,
+        ':read': 0,
+        'a:{': 3,
+    }
+
+    for resource, offset in resources.items():
+        [issue] = validate_resources([resource])
+        assert issue.offset == offset, resource
+
+
+def test_streams_lazily():
+    def principals():
+        yield 'a:b'
+        raise AssertionError('consumed too far')
+
+    assert next(validate_principals(principals())).index == 0
+
+
+def test_offsets_stay_out_of_exceptions():
+    with pytest.raises(TagthValidationError) as error:
+        compile_principal('user:read')
+    assert str(error.value) == 'Invalid principal format'
+
+    with pytest.raises(TagthValidationError) as error:
+        compile_resource('a:read, b')
+    assert str(error.value) == 'Invalid resource format'
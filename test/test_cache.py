@@ -0,0 +1,156 @@
+import pytest
+
+from tagth.cache import LRUCache
+from tagth.tagth import (
+    TagthValidationError,
+    _resolve,
+    allowed,
+    cache_stats,
+    disable_cache,
+    enable_cache,
+    validate_principal,
+    validate_resource,
+)
+
+
+@pytest.fixture
+def cache():
+    enable_cache(max_entries=8)
+    yield
+    disable_cache()
+
+
+def _counting_loader(calls):
+    def loader(value):
+        calls.append(value)
+        if value == 'bad':
+            raise TagthValidationError('Invalid format')
+        return [value]
+
+    return loader
+
+
+def test_disabled_by_default():
+    assert cache_stats() == {}
+
+
+def test_hits_and_misses(cache):
+    assert allowed('user', 'user:read', 'read')
+    assert allowed('user', 'user:read', 'read')
+    assert not allowed('user', 'user:read', 'write')
+
+    stats = cache_stats()
+    assert stats['principal'].hits == 2
+    assert stats['principal'].misses == 1
+    assert stats['resource'].hits == 2
+    assert stats['resource'].misses == 1
+    assert stats['resource'].entries == 1
+    assert stats['resource'].size > 0
+
+
+def test_cached_results_match(cache):
+    cases = [
+        ('root, user', 'content:read'),
+        ('', 'anyone:read'),
+        ('admin', 'admin_user:{read, write}, anyone:list'),
+        ('v', ' '),
+        ('user', ''),
+    ]
+
+    for p, r in cases:
+        expected = _resolve(p, r)
+        assert _resolve(p, r) == expected
+
+    disable_cache()
+
+    for p, r in cases:
+        assert _resolve(p, r) == _resolve(p, r)
+
+
+def test_invalid_strings_are_negatively_cached(cache):
+    for _ in range(3):
+        with pytest.raises(TagthValidationError, match='Invalid principal format') as e:
+            allowed('a b', 'user:read', 'read')
+        assert e.value.__cause__ is None
+        assert e.value.__suppress_context__
+
+    for _ in range(3):
+        with pytest.raises(TagthValidationError, match='Invalid resource format'):
+            allowed('user', 'user:{}', 'read')
+
+    assert not validate_principal('a b')
+    assert not validate_resource('user:{}')
+
+    stats = cache_stats()
+    assert stats['principal'].misses == 2
+    assert stats['principal'].hits == 5
+    assert stats['resource'].misses == 1
+    assert stats['resource'].hits == 3
+
+
+def test_type_errors_bypass_cache(cache):
+    with pytest.raises(TagthValidationError, match='Bad principal: expected a string'):
+        allowed(['user'], 'user:read', 'read')
+
+    assert not allowed('user', None, 'read')
+    assert cache_stats()['principal'].misses == 1
+    assert cache_stats()['resource'].misses == 0
+
+
+def test_max_entries_eviction():
+    calls = []
+    cache = LRUCache(_counting_loader(calls), TagthValidationError, max_entries=2)
+
+    cache.get('a')
+    cache.get('b')
+    cache.get('a')
+    cache.get('c')
+    cache.get('a')
+    cache.get('b')
+
+    assert calls == ['a', 'b', 'c', 'b']
+    assert cache.stats().evictions == 2
+    assert cache.stats().entries == 2
+
+
+def test_max_bytes_eviction():
+    calls = []
+    cache = LRUCache(_counting_loader(calls), TagthValidationError, max_bytes=400)
+
+    for key in ('a' * 40, 'b' * 40, 'c' * 40, 'd' * 40):
+        cache.get(key)
+
+    stats = cache.stats()
+    assert stats.size <= 400
+    assert stats.evictions == 4 - stats.entries
+    assert stats.evictions > 0
+
+
+def test_oversized_entries_are_not_cached():
+    calls = []
+    cache = LRUCache(_counting_loader(calls), TagthValidationError, max_bytes=100)
+
+    cache.get('x' * 200)
+    cache.get('x' * 200)
+
+    assert len(calls) == 2
+    assert cache.stats().entries == 0
+
+
+def test_negative_entry():
+    calls = []
+    cache = LRUCache(_counting_loader(calls), TagthValidationError)
+
+    for _ in range(2):
+        with pytest.raises(TagthValidationError, match='Invalid format'):
+            cache.get('bad')
+
+    assert calls == ['bad']
+
+
+def test_bad_limits():
+    with pytest.raises(ValueError):
+        LRUCache(list, TagthValidationError, max_entries=0)
+
+    with pytest.raises(ValueError):
+        LRUCache(list, TagthValidationError, max_bytes=0)
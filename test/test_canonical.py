@@ -0,0 +1,81 @@
+import random
+
+from corpus import ACTIONS, TAGS, random_principal, random_resource
+from tagth import canonicalize_principal, canonicalize_resource
+from tagth.tagth import allowed, compile_principal, compile_resource
+
+PROBE_ACTIONS = ACTIONS + ['read_x', 'alla', 'al_x', 'writer', 'zzz']
+
+
+def _probe_principals(rng):
+    return [random_principal(rng) for _ in range(30)] + TAGS + ['root', 'void']
+
+
+def test_resource_equivalent_under_allowed():
+    rng = random.Random(21)
+    principals = _probe_principals(rng)
+
+    for _ in range(250):
+        resource = random_resource(rng)
+        canonical = canonicalize_resource(resource)
+        assert len(compile_resource(canonical).pairs) <= len(compile_resource(resource).pairs)
+
+        for principal in principals:
+            for action in PROBE_ACTIONS:
+                assert allowed(principal, canonical, action) == allowed(principal, resource, action), (principal, resource, canonical, action)
+
+
+def test_resource_is_idempotent():
+    rng = random.Random(22)
+
+    for _ in range(500):
+        canonical = canonicalize_resource(random_resource(rng))
+        assert canonicalize_resource(canonical) == canonical
+        assert canonicalize_resource(compile_resource(canonical)) == canonical
+
+
+def test_resource_examples():
+    assert canonicalize_resource('x:read, x:read, x:{write, read}') == 'x:{read, write}'
+    assert canonicalize_resource('x:read, x:all, y:write') == 'x:all, y:write'
+    assert canonicalize_resource('x:read_all, x:read') == 'x:read'
+    assert canonicalize_resource('x:all, x:al') == 'x:all'
+    assert canonicalize_resource('x:al, x:alla') == 'x:al'
+    assert canonicalize_resource('a:read, ab:read, ab:write') == 'ab:{read, write}'
+    assert canonicalize_resource('anyone:read, anyone_x:read, x:{read_all, write}') == 'anyone:read, x:write'
+    assert canonicalize_resource('anyone_x:all, anyone:read') == 'anyone:read, anyone_x:all'
+    assert canonicalize_resource(' , x:read') == 'x:read'
+    assert canonicalize_resource(' ') == ''
+    assert canonicalize_resource('') == ''
+
+
+def test_principal_equivalent_under_allowed():
+    rng = random.Random(23)
+    resources = [random_resource(rng) for _ in range(40)] + [f'{tag}:all' for tag in TAGS]
+
+    for _ in range(250):
+        principal = random_principal(rng) + ', ' + random_principal(rng)
+        canonical = canonicalize_principal(principal)
+        assert len(compile_principal(canonical).tags) <= len(compile_principal(principal).tags)
+
+        for resource in resources:
+            for action in PROBE_ACTIONS:
+                assert allowed(canonical, resource, action) == allowed(principal, resource, action), (principal, canonical, resource, action)
+
+
+def test_principal_is_idempotent():
+    rng = random.Random(24)
+
+    for _ in range(500):
+        canonical = canonicalize_principal(random_principal(rng))
+        assert canonicalize_principal(canonical) == canonical
+        assert canonicalize_principal(compile_principal(canonical)) == canonical
+
+
+def test_principal_examples():
+    assert canonicalize_principal('admin_user, admin, admin') == 'admin'
+    assert canonicalize_principal('user, admin_user, me, meme') == 'admin_user, me, user'
+    assert canonicalize_principal('user, root, admin') == 'root'
+    assert canonicalize_principal('root_x, user') == 'root_x, user'
+    assert canonicalize_principal('user, , void') == 'user'
+    assert canonicalize_principal(' , void') == 'void'
+    assert canonicalize_principal('') == 'void'
@@ -0,0 +1,77 @@
+import random
+import struct
+
+import pytest
+
+from corpus import random_resource
+from tagth import decode_resource, encode_resource
+from tagth.codec import decode_pairs
+from tagth.tagth import TagthValidationError, _normalize_resource, allowed, compile_resource
+
+
+def test_round_trip():
+    rng = random.Random(25)
+
+    for _ in range(1000):
+        resource = random_resource(rng)
+        data = encode_resource(resource)
+        assert decode_resource(data) == compile_resource(resource), resource
+        assert set(decode_pairs(data)) == set(_normalize_resource(resource)), resource
+        assert encode_resource(decode_resource(data)) == data
+
+
+def test_decode_from_buffers():
+    data = encode_resource('café:{read, write}, anyone:list')
+    resource = decode_resource(memoryview(bytearray(b'..' + data))[2:])
+    assert resource == compile_resource('café:{read, write}, anyone:list')
+    assert allowed('caf', resource, 'write')
+    assert allowed('void', resource, 'list')
+
+
+def test_void_and_empty():
+    assert decode_resource(encode_resource('')).is_void
+    assert decode_resource(encode_resource(' ')).is_empty
+    assert decode_pairs(encode_resource(' ')) == [('@empty', 'all')]
+
+
+def test_strings_are_interned():
+    data = encode_resource('a:read, b:read, c:read')
+    assert data.count(b'read') == 1
+
+
+def test_invalid_data():
+    data = encode_resource('a:{read, write}')
+
+    for bad in (b'', b'XYZ\x01', data[:-1], data + b'\x00', b'TGR\x02' + data[4:], data[:5] + b'\xff' + data[6:]):
+        with pytest.raises(TagthValidationError, match='^Invalid binary resource$'):
+            decode_resource(bad)
+
+
+def _encode(strings, groups):
+    words = [len(strings)] + [len(string) for string in strings] + [len(groups)]
+
+    for (tag, actions) in groups:
+        words += [tag, len(actions)] + actions
+
+    return b'TGR\x01' + struct.pack(f'<H{len(words)}H', len(words), *words) + ''.join(strings).encode('utf-8')
+
+
+def test_ungrammatical_data():
+    assert decode_resource(_encode(['x', 'read'], [(0, [1])])) == compile_resource('x:read')
+    assert decode_resource(_encode(['@empty', 'all'], [(0, [1])])).is_empty
+
+    for bad in (
+        _encode(['x', ''], [(0, [1])]),
+        _encode(['a b', 'read'], [(0, [1])]),
+        _encode(['x', 'read:'], [(0, [1])]),
+        _encode(['1x', 'read'], [(0, [1])]),
+        _encode(['x', 'read'], [(0, [])]),
+        _encode(['@empty', 'read'], [(0, [1])]),
+        _encode(['x', '@empty'], [(0, [1])]),
+        _encode(['@x', 'read'], [(0, [1])]),
+    ):
+        with pytest.raises(TagthValidationError, match='^Invalid binary resource$'):
+            decode_resource(bad)
+
+        with pytest.raises(TagthValidationError, match='^Invalid binary resource$'):
+            decode_pairs(bad)
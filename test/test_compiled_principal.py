@@ -0,0 +1,136 @@
+import copy
+import pickle
+
+import pytest
+
+from tagth.tagth import (
+    CompiledPrincipal,
+    TagthValidationError,
+    _resolve,
+    _resolve_internal,
+    allowed,
+    compile_principal,
+)
+
+
+def test_compile_principal():
+    p = compile_principal('user, content, user, ')
+    assert p.tags == frozenset({'user', 'content'})
+    assert not p.is_root
+    assert not p.is_void
+
+
+def test_root_and_void_flags():
+    assert compile_principal('root, user').is_root
+    assert compile_principal('').is_void
+    assert compile_principal(' , void').is_void
+    assert not compile_principal('voider').is_void
+
+
+def test_immutable():
+    p = compile_principal('user')
+
+    with pytest.raises(AttributeError):
+        p.tags = frozenset({'root'})
+
+    with pytest.raises(AttributeError):
+        p.is_root = True
+
+    with pytest.raises(AttributeError):
+        del p.tags
+
+    with pytest.raises(AttributeError):
+        p.extra = 1
+
+
+def test_hashable_and_equal():
+    assert compile_principal('a, b') == compile_principal('b,a,a')
+    assert compile_principal('') == compile_principal('void')
+    assert compile_principal('a') != compile_principal('ab')
+    assert len({compile_principal('a, b'), compile_principal('b, a'), compile_principal('c')}) == 2
+
+
+def test_compile_is_idempotent():
+    p = compile_principal('user')
+    assert compile_principal(p) is p
+
+
+def test_invalid_principal():
+    with pytest.raises(TagthValidationError, match='Invalid principal format'):
+        compile_principal('a b')
+
+    with pytest.raises(TagthValidationError, match='Bad principal: expected a string'):
+        compile_principal(None)
+
+
+@pytest.mark.parametrize(
+    'p, r',
+    [
+        ('root, user', 'content:read'),
+        ('root', ''),
+        ('user', ''),
+        ('', 'anyone:read'),
+        ('void', 'content:read, anyone:write'),
+        ('admin', 'admin_user:write, admin_content:delete'),
+        ('me', 'xmememe:ro, meme:rw'),
+        ('v', ' '),
+    ]
+)
+def test_resolve_matches_strings(p, r):
+    assert _resolve(compile_principal(p), r) == _resolve(p, r)
+    assert _resolve_internal(compile_principal(p), []) == _resolve(p, '')
+
+
+@pytest.mark.parametrize(
+    'r, action',
+    [
+        ('content:read', 'read'),
+        ('content:read', 'read_all'),
+        ('content:a', 'all'),
+        ('content:all', 'write'),
+        ('anyone:read', 'read'),
+        ('', 'read'),
+        (' ', 'read'),
+    ]
+)
+def test_allowed_matches_strings(r, action):
+    for p in ('content', 'cont', 'root', '', 'other'):
+        assert allowed(compile_principal(p), r, action) == allowed(p, r, action)
+
+
+def test_repr():
+    assert repr(compile_principal('b, a')) == "CompiledPrincipal('a, b')"
+    assert repr(compile_principal('')) == "CompiledPrincipal('void')"
+    assert isinstance(compile_principal('a'), CompiledPrincipal)
+
+
+def test_covers():
+    p = compile_principal('admin, admin_user, me, void')
+    assert p.covers('admin')
+    assert p.covers('admin_content')
+    assert p.covers('meme')
+    assert not p.covers('adm')
+    assert not p.covers('void')
+    assert not p.covers('xme')
+    assert not compile_principal('').covers('anything')
+
+
+@pytest.mark.parametrize('size', [1, 5, 31, 32, 33, 200])
+def test_covers_matches_prefix_scan(size):
+    tags = [f't{i}' for i in range(size)] + [f't{i}_x' for i in range(0, size, 3)]
+    p = compile_principal(', '.join(tags))
+
+    for res_tag in ('t', 't0', 't1_x', 't10', 't199_y', 'u1', 't3_', 'zz', 'a'):
+        assert p.covers(res_tag) == any(res_tag.startswith(tag) for tag in tags)
+
+
+def test_pickle_and_copy():
+    for p in ('user, content', 'root', '', 'admin, admin_user'):
+        compiled = compile_principal(p)
+
+        for clone in (pickle.loads(pickle.dumps(compiled)), copy.copy(compiled), copy.deepcopy(compiled)):
+            assert clone == compiled
+            assert hash(clone) == hash(compiled)
+            assert clone.is_root == compiled.is_root
+            assert clone.is_void == compiled.is_void
+            assert allowed(clone, 'admin_user:read, content:write', 'read') == allowed(p, 'admin_user:read, content:write', 'read')
@@ -0,0 +1,114 @@
+import copy
+import pickle
+
+import pytest
+
+from tagth.tagth import (
+    CompiledResource,
+    TagthValidationError,
+    _resolve,
+    _resolve_internal,
+    allowed,
+    compile_principal,
+    compile_resource,
+)
+
+
+def test_compile_resource():
+    r = compile_resource('content:{read, write}, anyone:list, content:read, meta:all')
+    assert r.tag_actions == {
+        'content': frozenset({'read', 'write'}),
+        'anyone': frozenset({'list'}),
+        'meta': frozenset({'all'}),
+    }
+    assert r.anyone_actions == frozenset({'list'})
+    assert not r.is_void
+    assert not r.is_empty
+
+
+def test_void_and_empty_flags():
+    assert compile_resource('').is_void
+    assert compile_resource('').is_empty
+    assert not compile_resource(' ').is_void
+    assert compile_resource(' ').is_empty
+    assert compile_resource(' , ').is_empty
+    assert not compile_resource(', anyone:read').is_empty
+    assert compile_resource('content:read').anyone_actions == frozenset()
+
+
+def test_immutable():
+    r = compile_resource('content:read')
+
+    with pytest.raises(AttributeError):
+        r.pairs = frozenset()
+
+    with pytest.raises(TypeError):
+        r.tag_actions['content'] = frozenset({'write'})
+
+    with pytest.raises(AttributeError):
+        del r.is_void
+
+
+def test_hashable_and_equal():
+    assert compile_resource('a:{read, write}') == compile_resource('a:write, a:read, a:read')
+    assert compile_resource('a:read') != compile_resource('a:write')
+    assert len({compile_resource('a:read'), compile_resource('a:{read}'), compile_resource('')}) == 2
+
+
+def test_compile_is_idempotent():
+    r = compile_resource('a:read')
+    assert compile_resource(r) is r
+
+
+def test_invalid_resource():
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        compile_resource('a:{}')
+
+    with pytest.raises(TagthValidationError, match='Bad resource: expected a string'):
+        compile_resource(1)
+
+
+@pytest.mark.parametrize(
+    'p, r',
+    [
+        ('root, user', 'content:read'),
+        ('root', ''),
+        ('root', ' '),
+        ('user', ''),
+        ('v', ' '),
+        ('', 'anyone:read'),
+        ('void', 'content:read, anyone:write'),
+        ('admin', 'admin_user:write, admin_content:delete'),
+        ('me', 'xmememe:ro, meme:rw'),
+        ('any', 'anyone:{read, write}, other:delete'),
+    ]
+)
+def test_resolve_matches_strings(p, r):
+    expected = _resolve(p, r)
+    assert _resolve(p, compile_resource(r)) == expected
+    assert _resolve(compile_principal(p), compile_resource(r)) == expected
+    assert _resolve_internal(compile_principal(p), compile_resource(r)) == expected
+
+
+@pytest.mark.parametrize('action', ['read', 'read_all', 'all', 'write', 'a'])
+def test_allowed_matches_strings(action):
+    for r in ('content:read', 'content:a', 'content:all', 'anyone:read', '', ' ', 'content:{write, read}'):
+        for p in ('content', 'cont', 'root', '', 'other'):
+            assert allowed(p, compile_resource(r), action) == allowed(p, r, action)
+
+
+def test_repr():
+    assert repr(compile_resource('b:{y, x}')) == "CompiledResource('b:x, b:y')"
+    assert isinstance(compile_resource(''), CompiledResource)
+
+
+def test_pickle_and_copy():
+    for r in ('content:{read, write}, anyone:list', '', ' , ', 'meta:all'):
+        compiled = compile_resource(r)
+
+        for clone in (pickle.loads(pickle.dumps(compiled)), copy.copy(compiled), copy.deepcopy(compiled)):
+            assert clone == compiled
+            assert hash(clone) == hash(compiled)
+            assert clone.is_void == compiled.is_void
+            assert clone.is_empty == compiled.is_empty
+            assert clone.tag_actions == compiled.tag_actions
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from corpus import random_principal, random_resource
+from tagth.tagth import (
+    TagthValidationError,
+    _normalize_principal,
+    _normalize_resource,
+    _parse_principal_reference,
+    _parse_resource_reference,
+    _scan_principal,
+    _scan_resource,
+    _simple_principal,
+    _simple_resource,
+)
+
+PRINCIPALS = ['', 'root', 'void', 'anyone', 'user', '_x1', 'for', 'rooted', ' root', 'root ', 'a,b', 'é', 'a-b', '1a', 'a:b', ',']
+RESOURCES = ['anyone:read', 'a:all', '_x:y1', 'a: read', 'a :read', ' a:read', 'a:read ', 'a:b:c', ':read', 'a:', 'a:{read}', 'é:read', 'a:ré', '1a:read', 'a:1b', 'a:read,']
+
+
+def _reference(parse, string):
+    try:
+        return parse(string)
+    except TagthValidationError:
+        return 'invalid'
+
+
+@pytest.mark.parametrize('principal', PRINCIPALS)
+def test_principal_shapes(principal):
+    expected = _reference(_parse_principal_reference, principal)
+    assert _reference(_scan_principal, principal) == expected
+
+    simple = _simple_principal(principal)
+    assert simple is None or simple == expected
+    assert _reference(_normalize_principal, principal) == expected
+
+
+@pytest.mark.parametrize('resource', RESOURCES)
+def test_resource_shapes(resource):
+    expected = _reference(_parse_resource_reference, resource)
+    assert _reference(_scan_resource, resource) == expected
+
+    simple = _simple_resource(resource)
+    assert simple is None or simple == expected
+    assert _reference(_normalize_resource, resource) == expected
+
+
+def test_fast_path_taken():
+    assert _simple_principal('') == ['void']
+    assert _simple_principal('root') == ['root']
+    assert _simple_principal('void') == ['void']
+    assert _simple_resource('anyone:read') == [('anyone', 'read')]
+    assert _simple_principal('a, b') is None
+    assert _simple_resource('a:{read, write}') is None
+
+
+def test_random_strings_agree():
+    rng = random.Random(29)
+
+    for _ in range(2000):
+        principal = random_principal(rng).replace(', ', rng.choice(['', ',', ' ']))
+        simple = _simple_principal(principal)
+        assert simple is None or simple == _reference(_scan_principal, principal), principal
+
+        resource = random_resource(rng).replace(', ', rng.choice(['', ',', ' ']))
+        simple = _simple_resource(resource)
+        assert simple is None or simple == _reference(_scan_resource, resource), resource
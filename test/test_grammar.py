@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import tagth.tagth
+from tagth.tagth import _get_reference_parsers, _parse_principal_reference, _parse_resource_reference
+
+
+def test_grammars_are_shared():
+    principal_parser, resource_parser = _get_reference_parsers()
+    assert _get_reference_parsers() == (principal_parser, resource_parser)
+    assert principal_parser is principal_parser.streamline()
+    assert resource_parser is resource_parser.streamline()
+
+
+def test_concurrent_first_use(monkeypatch):
+    monkeypatch.setattr(tagth.tagth, '_reference_parsers', None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        parsers = list(pool.map(lambda _: _get_reference_parsers(), range(32)))
+
+    assert all(p is parsers[0] for p in parsers)
+
+
+def test_concurrent_parsing():
+    principals = [', '.join(f'tag_{i}_{j}' for j in range(i % 7 + 1)) for i in range(200)]
+    resources = [', '.join(f'tag_{i}_{j}:{{read, write_{j}}}' for j in range(i % 5 + 1)) for i in range(200)]
+
+    expected_principals = [_parse_principal_reference(p) for p in principals]
+    expected_resources = [_parse_resource_reference(r) for r in resources]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        actual_principals = list(pool.map(_parse_principal_reference, principals))
+        actual_resources = list(pool.map(_parse_resource_reference, resources))
+
+    assert actual_principals == expected_principals
+    assert actual_resources == expected_resources
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# Generous enough for slow CI machines, but well below the cost of importing pyparsing.
+IMPORT_BUDGET_US = 150_000
+
+
+def _import_tagth():
+    code = 'import sys, tagth; print("pyparsing" in sys.modules)'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True)
+
+    for line in result.stderr.splitlines():
+        _, cumulative, module = line.split('|')
+        if module.strip() == 'tagth':
+            return result.stdout.strip() == 'True', int(cumulative)
+
+    raise AssertionError('tagth import not reported')
+
+
+def test_pyparsing_is_not_imported():
+    pyparsing_imported, _ = _import_tagth()
+    assert not pyparsing_imported
+
+
+def test_import_time_budget():
+    assert min(_import_tagth()[1] for _ in range(3)) < IMPORT_BUDGET_US
+
+
+def test_pyparsing_is_imported_for_reference_engine():
+    code = (
+        'import sys, tagth\n'
+        'tagth.set_parse_engine(tagth.PARSE_ENGINE_PYPARSING)\n'
+        'assert tagth.allowed("a", "a:read", "read")\n'
+        'print("pyparsing" in sys.modules)'
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'True'
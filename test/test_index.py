@@ -0,0 +1,137 @@
+import random
+
+import pytest
+
+from corpus import ACTIONS, TAGS, random_principal, random_resource
+from tagth import PrincipalIndex, ResourceIndex
+from tagth.symbols import SYMBOLS
+from tagth.tagth import TagthValidationError, allowed, compile_resource
+
+
+def _expected(principal, resources, action):
+    return {resource_id for resource_id, resource in resources.items() if allowed(principal, resource, action)}
+
+
+def test_resource_index_matches_allowed():
+    rng = random.Random(16)
+    resources = {index: random_resource(rng) for index in range(300)}
+    index = ResourceIndex(resources.items())
+
+    for _ in range(300):
+        principal = random_principal(rng)
+        action = rng.choice(ACTIONS + ['read_x', 'alla', ''])
+        assert index.allowed(principal, action) == _expected(principal, resources, action), (principal, action)
+
+
+def test_resource_index_incremental_updates():
+    rng = random.Random(17)
+    resources = {}
+    index = ResourceIndex()
+
+    for _ in range(600):
+        resource_id = rng.randrange(50)
+
+        if resource_id in resources and rng.random() < 0.4:
+            del resources[resource_id]
+            index.remove(resource_id)
+        else:
+            resources[resource_id] = random_resource(rng)
+            index.add(resource_id, resources[resource_id])
+
+        principal = rng.choice(TAGS)
+        action = rng.choice(ACTIONS)
+        assert index.allowed(principal, action) == _expected(principal, resources, action)
+
+    for resource_id in list(resources):
+        index.remove(resource_id)
+
+    assert len(index) == 0
+    assert index._postings == {}
+
+
+def test_resource_index_special_cases():
+    index = ResourceIndex([(1, 'admin:all'), (2, 'anyone:read'), (3, ''), (4, ' '), (5, 'admin_user:{read_all, write}')])
+
+    assert index.allowed('root', 'delete') == {1, 2, 3, 4, 5}
+    assert index.allowed('void', 'read') == {2}
+    assert index.allowed('adm', 'read') == {1, 2}
+    assert index.allowed('admin_user', 'read_all') == {2, 5}
+    assert index.allowed('admin', 'read_all') == {1, 2, 5}
+    assert index.allowed('admin', 'all') == {1}
+    assert 3 in index and 6 not in index
+
+    with pytest.raises(KeyError):
+        index.remove(6)
+
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        index.allowed('admin', None)
+
+
+def _expected_principals(principals, resource, action):
+    return {principal_id for principal_id, principal in principals.items() if allowed(principal, resource, action)}
+
+
+def test_principal_index_matches_allowed():
+    rng = random.Random(18)
+    principals = {index: random_principal(rng) for index in range(300)}
+    index = PrincipalIndex(principals.items())
+
+    for _ in range(300):
+        resource = random_resource(rng)
+        action = rng.choice(ACTIONS + ['read_x', 'alla', ''])
+        assert index.allowed(resource, action) == _expected_principals(principals, resource, action), (resource, action)
+
+
+def test_principal_index_incremental_updates():
+    rng = random.Random(19)
+    principals = {}
+    index = PrincipalIndex()
+
+    for _ in range(600):
+        principal_id = rng.randrange(50)
+
+        if principal_id in principals and rng.random() < 0.4:
+            del principals[principal_id]
+            index.remove(principal_id)
+        else:
+            principals[principal_id] = random_principal(rng)
+            index.add(principal_id, principals[principal_id])
+
+        resource = random_resource(rng)
+        action = rng.choice(ACTIONS)
+        assert index.allowed(resource, action) == _expected_principals(principals, resource, action)
+
+    for principal_id in list(principals):
+        index.remove(principal_id)
+
+    assert len(index) == 0
+    assert index._postings == {} and index._roots == set()
+
+
+def test_principal_index_special_cases():
+    index = PrincipalIndex([(1, 'root'), (2, 'void'), (3, 'adm'), (4, 'admin_user, me'), (5, '')])
+
+    assert index.allowed('', 'read') == {1}
+    assert index.allowed(' ', 'read') == {1}
+    assert index.allowed('anyone:read', 'read_all') == {1, 2, 3, 4, 5}
+    assert index.allowed('anyone:read', 'write') == {1}
+    assert index.allowed('admin_user_x:all', 'delete') == {1, 3, 4}
+    assert index.allowed('admin:read', 'all') == {1}
+    assert 5 in index and 6 not in index
+
+    with pytest.raises(KeyError):
+        index.remove(6)
+
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        index.allowed('admin:read', None)
+
+
+def test_principal_index_queries_do_not_intern():
+    index = PrincipalIndex([(1, 'adm'), (2, 'admin_user')])
+    before = len(SYMBOLS)
+
+    for i in range(1000):
+        assert index.allowed(f'admin_user_{i}:{{read, index_action_{i}}}', 'read') == {1, 2}
+
+    assert len(SYMBOLS) == before
+    assert index.allowed(compile_resource('admin:read'), 'read') == {1}
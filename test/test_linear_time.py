@@ -0,0 +1,84 @@
+"""Adversarial inputs: scanner parse time must grow linearly with the input length, and
+canonicalization time near-linearly with the number of pairs."""
+
+import time
+
+import pytest
+
+from tagth.canonical import canonicalize_resource
+from tagth.tagth import TagthValidationError, _normalize_principal, _normalize_resource
+
+SMALL = 4000
+SCALE = 8
+# Linear growth gives a ratio near SCALE and quadratic growth near SCALE ** 2; the bound leaves
+# room for timer noise on loaded machines.
+MAX_RATIO = SCALE * 2.5
+
+PRINCIPALS = {
+    'comma run': lambda n: ',' * n,
+    'whitespace run': lambda n: ' ' * n,
+    'long identifier': lambda n: 'a' * n,
+    'many tags': lambda n: 'a, ' * n,
+    'separated identifiers': lambda n: 'a' + ' ' * n + 'b',
+}
+
+RESOURCES = {
+    'comma run': lambda n: ',' * n,
+    'many pairs': lambda n: 'a:b, ' * n,
+    'long brace group': lambda n: 'a:{' + 'x, ' * n + 'x}',
+    'unclosed brace group': lambda n: 'a:{' + 'x, ' * n,
+    'unclosed brace whitespace': lambda n: 'a:{x' + ' ' * n,
+    'long identifiers': lambda n: 'a' * n + ':' + 'b' * n,
+    'nested braces': lambda n: 'a:' + '{' * n,
+    'many empty modules': lambda n: ' ,' * n,
+}
+
+
+CANONICAL_SMALL = 1000
+
+CANONICAL_RESOURCES = {
+    'long brace group': lambda n: 'a:{' + ', '.join(f'act_{i}' for i in range(n)) + '}',
+    'many tags': lambda n: ', '.join(f'tag_{i}:read' for i in range(n)),
+    'prefixed tags': lambda n: ', '.join(f't{i}:read' for i in range(n)),
+    'prefixed actions': lambda n: 'a:{' + ', '.join(f'r{i}' for i in range(n)) + '}, ab:r',
+    'anyone grants': lambda n: ', '.join(f'tag_{i}:{{read, act_{i}}}, anyone:act_{i}' for i in range(n)),
+}
+
+
+def _best_time(normalize, string):
+    best = float('inf')
+
+    for _ in range(5):
+        start = time.perf_counter()
+        try:
+            normalize(string)
+        except TagthValidationError:
+            pass
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def _assert_linear(normalize, make):
+    small = _best_time(normalize, make(SMALL))
+    large = _best_time(normalize, make(SMALL * SCALE))
+    # Inputs that are rejected within the first few characters take constant time.
+    assert large < 1e-4 or large / small < MAX_RATIO, (small, large)
+
+
+@pytest.mark.parametrize('name', PRINCIPALS)
+def test_principal_parse_time_is_linear(name):
+    _assert_linear(_normalize_principal, PRINCIPALS[name])
+
+
+@pytest.mark.parametrize('name', RESOURCES)
+def test_resource_parse_time_is_linear(name):
+    _assert_linear(_normalize_resource, RESOURCES[name])
+
+
+@pytest.mark.parametrize('name', CANONICAL_RESOURCES)
+def test_canonicalize_time_is_near_linear(name):
+    make = CANONICAL_RESOURCES[name]
+    small = _best_time(canonicalize_resource, make(CANONICAL_SMALL))
+    large = _best_time(canonicalize_resource, make(CANONICAL_SMALL * SCALE))
+    assert large / small < MAX_RATIO, (small, large)
@@ -0,0 +1,79 @@
+import random
+import tracemalloc
+
+import pytest
+
+from corpus import ACTIONS, random_principal, random_resource
+from tagth.matrix import allowed_pairs, permission_matrix
+from tagth.tagth import TagthValidationError, allowed
+
+np = pytest.importorskip('numpy')
+
+
+def _corpus(seed, principals, resources):
+    rng = random.Random(seed)
+    return [random_principal(rng) for _ in range(principals)], [random_resource(rng) for _ in range(resources)]
+
+
+@pytest.mark.parametrize('action', ACTIONS + ['read_x'])
+def test_matches_allowed(action):
+    principals, resources = _corpus(16, 60, 150)
+    matrix = permission_matrix(principals, resources, action, chunk_size=32)
+
+    assert matrix.shape == (60, 150)
+    assert matrix.dtype == bool
+
+    for i, p in enumerate(principals):
+        for j, r in enumerate(resources):
+            assert matrix[i, j] == allowed(p, r, action), (p, r, action)
+
+
+def test_allowed_pairs():
+    principals, resources = _corpus(17, 40, 100)
+    matrix = permission_matrix(principals, resources, 'read')
+    pairs = allowed_pairs(principals, resources, 'read', chunk_size=7)
+
+    assert sorted(pairs) == sorted(zip(*np.nonzero(matrix)))
+
+
+def test_special_values():
+    matrix = permission_matrix(['root', 'v', '', 'a'], ['', ' ', 'anyone:read', 'a:read'], 'read')
+    assert matrix.tolist() == [
+        [True, True, True, True],
+        [False, False, True, False],
+        [False, False, True, False],
+        [False, False, True, True],
+    ]
+
+
+def test_empty_inputs():
+    assert permission_matrix([], ['a:read'], 'read').shape == (0, 1)
+    assert permission_matrix(['a'], [], 'read').shape == (1, 0)
+    assert list(allowed_pairs(['a'], ['b:read'], 'read')) == []
+
+
+def test_invalid_input():
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        permission_matrix(['a'], ['a:read'], None)
+
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        permission_matrix(['a'], ['a:{}'], 'read')
+
+    with pytest.raises(ValueError):
+        permission_matrix(['a'], ['a:read'], 'read', chunk_size=0)
+
+
+def test_memory_is_bounded_by_the_chunk():
+    principals = [f'user_{i}, team_{i % 10}' for i in range(500)]
+    resources = [f'doc_{i}:read' for i in range(10000)] + ['team_3:read']
+
+    tracemalloc.start()
+    try:
+        pairs = list(allowed_pairs(principals, resources, 'read', chunk_size=10))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert pairs == [(i, 10000) for i in range(3, 500, 10)]
+    # A coverage matrix over the granting tags of all resources alone would take 20 MB.
+    assert peak < 500 * 10000 * 4 / 8
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from pyparsing import identbodychars, identchars
+
+from tagth.tagth import (
+    _IDENT_BODY,
+    _IDENT_START,
+    PARSE_ENGINE_PYPARSING,
+    PARSE_ENGINE_SCANNER,
+    TagthValidationError,
+    _normalize_principal,
+    _normalize_resource,
+    _parse_principal_reference,
+    _parse_resource_reference,
+    _scan_principal,
+    _scan_resource,
+    get_parse_engine,
+    set_parse_engine,
+)
+
+PRINCIPAL_CASES = [
+    '', ' ', ',', ' , ', ',,', 'a', ' a ', 'a,b', 'a, b', 'a ,b', 'a,,b', 'a,', ',a',
+    'a b', '1a', 'a-b', 'a@', '\ta,\nb\r', 'a\x0bb', 'a\xa0', 'äöü, ß', 'a·b', '·a',
+    'tag_1, tag_2, ', 'root, void', 'a:b', '{a}', 'ā',
+]
+
+RESOURCE_CASES = [
+    '', ' ', ',', ' , ', 'a:b', ' a : b ', 'a:b,c:d', 'a:b, ,c:d', 'a:{b}', 'a:{b,c}', 'a : { b , c } ',
+    'a:{}', 'a:{b,}', 'a:{,b}', 'a:{b c}', 'a:{b', 'a:b}', 'a', 'a:', ':b', 'a:b:c', 'a:b c:d', 'a:{b},',
+    ',a:{b}', 'a:{b}{c}', 'a:{{b}}', 'a:b{', '1a:b', 'a:1b', 'a-b:c', '\ta:\n{b,\rc}', 'a:{b}\x0b',
+    'äö:ß', 'anyone:all, me:{read, write_1}, ', 'a:{b,\tc,\nd}',
+]
+
+
+def _outcome(parse, value):
+    try:
+        return parse(value)
+    except TagthValidationError as e:
+        return ('error', str(e))
+
+
+def _random_string(rng, alphabet, size):
+    return ''.join(rng.choice(alphabet) for _ in range(size))
+
+
+def test_scanner_character_sets_match_pyparsing():
+    assert set(_IDENT_START) == set(identchars)
+    assert set(_IDENT_BODY) == set(identbodychars)
+
+
+@pytest.mark.parametrize('principal', PRINCIPAL_CASES)
+def test_principal_engines_agree(principal):
+    assert _outcome(_scan_principal, principal) == _outcome(_parse_principal_reference, principal)
+
+
+@pytest.mark.parametrize('resource', RESOURCE_CASES)
+def test_resource_engines_agree(resource):
+    assert _outcome(_scan_resource, resource) == _outcome(_parse_resource_reference, resource)
+
+
+def test_engines_agree_on_random_input():
+    rng = random.Random(20240518)
+    principal_alphabet = ['a', 'b', 'ab', '_', '1', ',', ' ', '\t', '-', 'é']
+    resource_alphabet = principal_alphabet + [':', ':', '{', '}', 'x:y', 'x:{y, z}']
+
+    for _ in range(2000):
+        principal = _random_string(rng, principal_alphabet, rng.randint(0, 8))
+        assert _outcome(_scan_principal, principal) == _outcome(_parse_principal_reference, principal), principal
+
+        resource = _random_string(rng, resource_alphabet, rng.randint(1, 10))
+        assert _outcome(_scan_resource, resource) == _outcome(_parse_resource_reference, resource), resource
+
+
+def test_select_engine():
+    assert get_parse_engine() == PARSE_ENGINE_SCANNER
+
+    try:
+        set_parse_engine(PARSE_ENGINE_PYPARSING)
+        assert get_parse_engine() == PARSE_ENGINE_PYPARSING
+        assert _normalize_principal('a, ') == ['a', 'void']
+        assert _normalize_resource('a:{b, c}') == [('a', 'b'), ('a', 'c')]
+
+        with pytest.raises(TagthValidationError, match='Invalid resource format'):
+            _normalize_resource('a:{}')
+    finally:
+        set_parse_engine(PARSE_ENGINE_SCANNER)
+
+    assert get_parse_engine() == PARSE_ENGINE_SCANNER
+
+
+def test_select_unknown_engine():
+    with pytest.raises(ValueError):
+        set_parse_engine('regex')
+
+    assert get_parse_engine() == PARSE_ENGINE_SCANNER
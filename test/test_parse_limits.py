@@ -0,0 +1,93 @@
+import pytest
+
+from tagth import (
+    VALIDATION_TOO_LARGE,
+    ParseLimits,
+    TagthValidationError,
+    ValidationIssue,
+    allowed,
+    cache_stats,
+    disable_cache,
+    enable_cache,
+    get_parse_limits,
+    set_parse_engine,
+    set_parse_limits,
+    validate_principal,
+    validate_principals,
+    validate_resource,
+    validate_resources,
+)
+from tagth.tagth import PARSE_ENGINE_PYPARSING, PARSE_ENGINE_SCANNER
+
+
+@pytest.fixture(autouse=True)
+def reset_limits():
+    yield
+    set_parse_limits()
+    set_parse_engine(PARSE_ENGINE_SCANNER)
+    disable_cache()
+
+
+def test_unlimited_by_default():
+    assert get_parse_limits() == ParseLimits(None, None)
+    assert validate_principal(', '.join(['a'] * 10000))
+    assert validate_resource('a:{' + ', '.join(['read'] * 10000) + '}')
+
+
+@pytest.mark.parametrize('engine', [PARSE_ENGINE_SCANNER, PARSE_ENGINE_PYPARSING])
+def test_max_length(engine):
+    set_parse_engine(engine)
+    set_parse_limits(max_length=10)
+    assert get_parse_limits() == ParseLimits(10, None)
+
+    assert allowed('a, b, c, d', 'd' * 8 + ':x', 'x')
+
+    with pytest.raises(TagthValidationError, match='^Principal exceeds the parse limits$'):
+        allowed('a' * 11, 'a:x', 'x')
+
+    with pytest.raises(TagthValidationError, match='^Resource exceeds the parse limits$'):
+        allowed('a', 'a' * 9 + ':x', 'x')
+
+    assert validate_resource('')
+
+
+@pytest.mark.parametrize('engine', [PARSE_ENGINE_SCANNER, PARSE_ENGINE_PYPARSING])
+def test_max_elements(engine):
+    set_parse_engine(engine)
+    set_parse_limits(max_elements=3)
+
+    assert validate_principal('a, b, c')
+    assert not validate_principal('a, b, c, d')
+    assert validate_resource('a:{x, y}, b:z')
+    assert not validate_resource('a:{x, y}, b:{z, w}')
+    assert not validate_resource(',,,')
+
+
+def test_bulk_validation():
+    set_parse_limits(max_length=5)
+
+    assert list(validate_principals(['a', 'a' * 6, 'a:b'])) == [
+        ValidationIssue(1, VALIDATION_TOO_LARGE, None),
+        ValidationIssue(2, 'bad_format', 1),
+    ]
+    assert list(validate_resources(['a:b', 'a:bcde', ''])) == [ValidationIssue(1, VALIDATION_TOO_LARGE, None)]
+
+
+def test_clears_caches():
+    enable_cache()
+    assert not allowed('a' * 20, 'a:x', 'x')
+    assert cache_stats()['principal'].entries == 1
+
+    set_parse_limits(max_length=10)
+    assert cache_stats()['principal'].entries == 0
+
+    with pytest.raises(TagthValidationError):
+        allowed('a' * 20, 'a:x', 'x')
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        set_parse_limits(max_length=0)
+
+    with pytest.raises(ValueError):
+        set_parse_limits(max_elements=-1)
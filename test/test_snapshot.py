@@ -0,0 +1,192 @@
+import multiprocessing
+import os
+import random
+import struct
+
+import pytest
+
+from corpus import ACTIONS, random_principal, random_resource
+from tagth import PolicySnapshot, write_snapshot
+from tagth.symbols import SYMBOLS
+from tagth.tagth import TagthValidationError, allowed, compile_principal, compile_resource
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(26)
+    principals = [random_principal(rng) for _ in range(200)] + ['root', 'void', '', 'café, caf']
+    resources = [random_resource(rng) for _ in range(200)] + ['', ' ', 'anyone:read', 'café_x:{read, write}']
+    return principals, resources
+
+
+def test_entries_match_compiled(tmp_path, corpus):
+    principals, resources = corpus
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, principals, resources)
+
+    with PolicySnapshot(path) as snapshot:
+        for principal in principals:
+            assert snapshot._find(snapshot._principals, principal) is not None
+            assert snapshot.principal(principal) == compile_principal(principal)
+
+        for resource in resources:
+            assert snapshot._find(snapshot._resources, resource) is not None
+            assert snapshot.resource(resource) == compile_resource(resource)
+
+
+def test_allowed_matches_with_fallback(tmp_path, corpus):
+    principals, resources = corpus
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, principals[::2], resources[::2])
+    rng = random.Random(27)
+
+    with PolicySnapshot(path) as snapshot:
+        for _ in range(3000):
+            p, r, action = rng.choice(principals), rng.choice(resources), rng.choice(ACTIONS + ['read_x'])
+            assert snapshot.allowed(p, r, action) == allowed(p, r, action), (p, r, action)
+
+        assert snapshot._find(snapshot._principals, 'missing') is None
+        assert snapshot.allowed(compile_principal('a'), compile_resource('a:read'), 'read')
+
+        with pytest.raises(TagthValidationError, match='Invalid principal format'):
+            snapshot.principal('a:read')
+
+        with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+            snapshot.allowed('a', 'a:read', None)
+
+
+def _check_in_worker(path, principal, resource):
+    with PolicySnapshot(path) as snapshot:
+        return snapshot.allowed(principal, resource, 'write')
+
+
+def test_shared_between_processes(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, ['editor'], ['editor_docs:{read, write}'])
+
+    with multiprocessing.get_context('spawn').Pool(2) as pool:
+        assert pool.starmap(_check_in_worker, [(str(path), 'editor', 'editor_docs:{read, write}')] * 2) == [True, True]
+
+
+def test_rewrite_keeps_open_snapshot_valid(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, ['a'], ['a:read'])
+
+    with PolicySnapshot(path) as old:
+        write_snapshot(path, ['b'], ['b:read'])
+
+        with PolicySnapshot(path) as new:
+            assert old._find(old._resources, 'a:read') is not None
+            assert new._find(new._resources, 'a:read') is None
+            assert new._find(new._resources, 'b:read') is not None
+
+    assert [p.name for p in tmp_path.iterdir()] == ['policy.snapshot']
+
+
+def test_file_mode_follows_umask(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+    umask = os.umask(0o027)
+
+    try:
+        write_snapshot(path, ['a'], ['a:read'])
+    finally:
+        os.umask(umask)
+
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_invalid_input(tmp_path):
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        write_snapshot(tmp_path / 'bad.snapshot', [], ['a:{}'])
+
+    assert list(tmp_path.iterdir()) == []
+
+    for data in (b'', b'XYZ\x01' + bytes(12), b'TGS\x01' + bytes(4) + b'\xff' * 8):
+        path = tmp_path / 'bad.snapshot'
+        path.write_bytes(data)
+
+        with pytest.raises(TagthValidationError, match='^Invalid snapshot$'):
+            PolicySnapshot(path)
+
+
+def _symbols_in_worker(path):
+    # Returns which of the snapshot strings are interned after each step, in a fresh process.
+    names = ('lazy_p', 'lazy_r', 'lazy_a', 'unused_r', 'missing_p', 'missing_r', 'missing_a')
+    steps = []
+
+    with PolicySnapshot(path) as snapshot:
+        steps.append({name for name in names if name in SYMBOLS})
+        snapshot.allowed('lazy_p', 'lazy_r:lazy_a', 'lazy_a')
+        steps.append({name for name in names if name in SYMBOLS})
+        snapshot.allowed('missing_p', 'missing_r:missing_a', 'read')
+        steps.append({name for name in names if name in SYMBOLS})
+
+    return steps
+
+
+def test_strings_are_interned_on_load(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, ['lazy_p'], ['lazy_r:lazy_a', 'unused_r:read'])
+
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        steps = pool.apply(_symbols_in_worker, (str(path),))
+
+    assert steps == [set(), {'lazy_p', 'lazy_r', 'lazy_a'}, {'lazy_p', 'lazy_r', 'lazy_a'}]
+
+
+def _corrupt(path, patch):
+    data = bytearray(path.read_bytes())
+    _, _, string_count, principal_slots, resource_slots = struct.unpack_from('<3sB3I', data)
+    start = 16 + 4 * (string_count + 1)
+
+    for position in range(start, start + 12 * (principal_slots + resource_slots), 12):
+        (entry,) = struct.unpack_from('<I', data, position + 8)
+
+        if entry:
+            patch(data, position + 8, entry)
+
+    path.write_bytes(bytes(data))
+
+
+def test_corrupt_entries(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+
+    def word_count(data, slot, entry):
+        (key_length,) = struct.unpack_from('<I', data, entry)
+        struct.pack_into('<I', data, entry + 4 + key_length, 0xFFFFFF)
+
+    def word(data, slot, entry):
+        (key_length,) = struct.unpack_from('<I', data, entry)
+        struct.pack_into('<I', data, entry + 8 + key_length, 0xFFFFFF)
+
+    patches = (
+        lambda data, slot, entry: struct.pack_into('<I', data, slot, len(data) - 2),
+        lambda data, slot, entry: struct.pack_into('<I', data, slot, 0xFFFFFFF0),
+        lambda data, slot, entry: struct.pack_into('<I', data, entry, 0xFFFFFFF0),
+        word_count,
+        word,
+    )
+
+    for patch in patches:
+        write_snapshot(path, ['a'], ['a:read'])
+        _corrupt(path, patch)
+
+        with PolicySnapshot(path) as snapshot:
+            with pytest.raises(TagthValidationError, match='^Invalid snapshot$'):
+                snapshot.allowed('a', 'a:read', 'read')
+
+            with pytest.raises(TagthValidationError, match='^Invalid snapshot$'):
+                snapshot.resource('a:read')
+
+
+def test_misses_do_not_intern(tmp_path):
+    path = tmp_path / 'policy.snapshot'
+    write_snapshot(path, ['a'], ['a:read'])
+
+    with PolicySnapshot(path) as snapshot:
+        before = len(SYMBOLS)
+
+        for i in range(1000):
+            assert snapshot.allowed(f'snapshot_user_{i}', f'snapshot_user_{i}:{{read, snapshot_action_{i}}}', 'read')
+
+        assert len(SYMBOLS) == before
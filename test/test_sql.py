@@ -0,0 +1,67 @@
+import random
+import sqlite3
+
+import pytest
+
+from corpus import ACTIONS, random_principal, random_resource
+from tagth.sql import acl_rows, sql_predicate
+from tagth.tagth import TagthValidationError, allowed
+
+
+def _database(resources):
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE document (id INTEGER PRIMARY KEY, acl TEXT)')
+    connection.execute('CREATE TABLE resource_acl (resource_id INTEGER, tag TEXT, action TEXT)')
+    connection.execute('CREATE INDEX resource_acl_action_tag ON resource_acl (action, tag)')
+
+    for resource_id, resource in enumerate(resources):
+        connection.execute('INSERT INTO document VALUES (?, ?)', (resource_id, resource))
+        connection.executemany('INSERT INTO resource_acl VALUES (?, ?, ?)', acl_rows(resource_id, resource))
+
+    return connection
+
+
+def _select(connection, principal, action):
+    predicate, params = sql_predicate(principal, action)
+    return {row[0] for row in connection.execute(f'SELECT id FROM document WHERE {predicate}', params)}
+
+
+def test_matches_allowed():
+    rng = random.Random(20)
+    resources = [random_resource(rng) for _ in range(300)]
+    connection = _database(resources)
+
+    for _ in range(300):
+        principal = random_principal(rng)
+        action = rng.choice(ACTIONS + ['read_x', 'alla', 'Read'])
+        expected = {index for index, resource in enumerate(resources) if allowed(principal, resource, action)}
+        assert _select(connection, principal, action) == expected, (principal, action)
+
+
+def test_special_cases():
+    resources = ['Admin:read', 'admin_x:read', 'admin:read', 'café_menu:read', 'caf:all', '', ' ', 'anyone:write']
+    connection = _database(resources)
+
+    assert _select(connection, 'root', 'read') == set(range(len(resources)))
+    assert _select(connection, 'admin', 'read') == {1, 2}
+    assert _select(connection, 'café', 'read_all') == {3}
+    assert _select(connection, 'caf', 'all') == {4}
+    assert _select(connection, 'void', 'write') == {7}
+    assert _select(connection, '', 'read') == set()
+
+
+def test_acl_rows():
+    assert acl_rows(1, 'b:{read, write}, a:read') == [(1, 'a', 'read'), (1, 'b', 'read'), (1, 'b', 'write')]
+    assert acl_rows(2, '') == []
+    assert acl_rows(3, ' ') == [(3, '@empty', 'all')]
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError, match='Invalid SQL identifier'):
+        sql_predicate('admin', 'read', table='acl; DROP TABLE document')
+
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        sql_predicate('admin', None)
+
+    with pytest.raises(TagthValidationError, match='Invalid principal format'):
+        sql_predicate('admin:read', 'read')
@@ -0,0 +1,62 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from tagth.batch import allowed_many
+from tagth.symbols import SYMBOLS, SymbolTable
+from tagth.tagth import allowed, compile_principal, compile_resource
+
+
+def test_intern():
+    table = SymbolTable()
+    assert table.intern('read') == 0
+    assert table.intern('write') == 1
+    assert table.intern('read') == 0
+    assert table.get('write') == 1
+    assert table.get('delete') is None
+    assert table.symbol(1) == 'write'
+    assert 'read' in table
+    assert 'delete' not in table
+    assert len(table) == 2
+
+
+def test_concurrent_intern():
+    table = SymbolTable()
+    symbols = [f's{i % 100}' for i in range(5000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(table.intern, symbols))
+
+    assert len(table) == 100
+    assert all(table.symbol(symbol_id) == symbol for symbol_id, symbol in zip(ids, symbols))
+
+
+def test_compiled_forms_share_interned_strings():
+    tag = ''.join(['shared', '_tag'])
+    p = compile_principal(tag)
+    r = compile_resource(f'{tag}:read')
+
+    interned = SYMBOLS.symbol(SYMBOLS.get(tag))
+    assert next(iter(p.tags)) is interned
+    assert next(iter(r.tag_actions)) is interned
+
+
+def test_compiled_forms_store_compact_forms():
+    r = compile_resource('b:{read, write}, a:read')
+    tag_ids = [SYMBOLS.get(res_tag) for (res_tag, _) in r._table]
+    assert tag_ids == sorted(tag_ids) and len(tag_ids) == 2
+    assert all(list(actions) == sorted(actions, key=SYMBOLS.get) for (_, actions) in r._table)
+    assert all(res_tag is SYMBOLS.symbol(SYMBOLS.get(res_tag)) for (res_tag, _) in r._table)
+    assert r == compile_resource('a:read, b:{write, read}')
+    assert hash(r) == hash(compile_resource('a:read, b:{write, read}'))
+    assert isinstance(compile_principal('a, b')._tag_ids, array)
+
+
+def test_string_checks_do_not_intern():
+    before = len(SYMBOLS)
+
+    for i in range(10000):
+        allowed(f'tenant_user_{i}, editor', 'content:read', 'read')
+        allowed_many(f'tenant_other_{i}', ['content:read', 'anyone:list'], 'list')
+
+    assert len(SYMBOLS) == before
+    assert SYMBOLS.get('tenant_user_0') is None
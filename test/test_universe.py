@@ -0,0 +1,111 @@
+import pickle
+import random
+
+import pytest
+
+from corpus import ACTIONS, TAGS, random_principal, random_resource, random_triples
+from tagth import TagUniverse
+from tagth.symbols import SYMBOLS
+from tagth.tagth import TagthValidationError, allowed, compile_principal
+
+
+@pytest.fixture
+def universe():
+    return TagUniverse(TAGS, ACTIONS)
+
+
+def test_matches_allowed(universe):
+    for p, r, action in random_triples(13, 3000):
+        assert universe.allowed(p, r, action) == allowed(p, r, action), (p, r, action)
+
+
+def test_matches_allowed_with_partial_universe():
+    universe = TagUniverse(TAGS[::2], ACTIONS[::2])
+
+    for p, r, action in random_triples(14, 3000):
+        assert universe.allowed(p, r, action) == allowed(p, r, action), (p, r, action)
+
+
+def test_compiled_forms_are_reused(universe):
+    rng = random.Random(15)
+    principals = [universe.compile_principal(random_principal(rng)) for _ in range(30)]
+    resources = [universe.compile_resource(random_resource(rng)) for _ in range(30)]
+
+    for principal in principals:
+        for resource in resources:
+            for action in ACTIONS + ['read_x', 'zzz']:
+                expected = allowed(principal.principal, resource.resource, action)
+                assert universe.allowed(principal, resource, action) == expected
+
+
+def test_principal_mask(universe):
+    principal = universe.compile_principal('adm, void')
+    covered = {tag for bit, tag in enumerate(universe.tags) if principal.mask >> bit & 1}
+    assert covered == {'admin', 'admin_user', 'anyone'}
+
+    assert universe.compile_principal(compile_principal('')).mask == 1 << universe.tags.index('anyone')
+
+
+def test_fallback_outside_universe(universe):
+    resource = universe.compile_resource('unknown:read, a:read')
+    assert resource.grants is None
+    assert universe.allowed('unk', resource, 'read')
+    assert not universe.allowed('x', resource, 'read')
+
+    resource = universe.compile_resource('a:unknown_action')
+    assert resource.grants is None
+    assert universe.allowed('a', resource, 'unknown_action_x')
+
+
+def test_special_values(universe):
+    assert universe.allowed('root', '', 'read')
+    assert not universe.allowed('v', ' ', 'read')
+    assert universe.allowed('', 'anyone:read', 'read_all')
+    assert not universe.allowed('a', 'a:al', 'all')
+    assert universe.allowed('a', 'a:all', 'all')
+
+
+def test_invalid_input(universe):
+    with pytest.raises(TagthValidationError, match='Bad action: expected a string'):
+        universe.allowed('a', 'a:read', None)
+
+    with pytest.raises(TagthValidationError, match='Invalid resource format'):
+        universe.allowed('root', 'a:{}', 'read')
+
+
+def test_compiled_forms_are_immutable_and_hashable(universe):
+    principal = universe.compile_principal('admin, user')
+    resource = universe.compile_resource('admin:read, a:write')
+    outside = universe.compile_resource('unknown:read')
+
+    for compiled in (principal, resource, outside):
+        with pytest.raises(AttributeError):
+            compiled.extra = 1
+
+    with pytest.raises(AttributeError):
+        principal.mask = 0
+    with pytest.raises(AttributeError):
+        del resource.grants
+    with pytest.raises(TypeError):
+        resource.grants[0] = 0
+
+    assert principal == universe.compile_principal('user, admin, admin')
+    assert resource == universe.compile_resource('a:write, admin:read')
+    assert outside == universe.compile_resource('unknown:read')
+    assert principal != universe.compile_principal('admin')
+    assert resource != outside
+    assert len({principal, universe.compile_principal('user, admin'), resource, universe.compile_resource('admin:read, a:write')}) == 2
+
+    for compiled in (principal, resource, outside):
+        assert pickle.loads(pickle.dumps(compiled)) == compiled
+
+
+def test_string_checks_do_not_intern(universe):
+    before = len(SYMBOLS)
+
+    for i in range(1000):
+        universe.allowed(f'universe_user_{i}, admin', 'admin:read', 'read')
+        universe.allowed('admin', f'universe_tag_{i}:read, admin:read', f'universe_action_{i}')
+
+    assert len(SYMBOLS) == before
+    assert SYMBOLS.get('universe_user_0') is None